@@ -1,2 +1,6 @@
 from .experiment import experiment
-from .algorithms import *
+from .lazy import lazy as _lazy
+from . import algorithms
+
+__all__ = ['experiment'] + algorithms.__all__
+__getattr__, __dir__ = _lazy(__name__, {name: '.algorithms' for name in algorithms.__all__})
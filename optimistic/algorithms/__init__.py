@@ -1,3 +1,15 @@
-from .algorithm import Algorithm
-from .grid_search import GridSearch
-from .gradient_descent import GradientDescent
+from optimistic.lazy import lazy
+
+__all__ = ['Algorithm', 'GridSearch', 'GradientDescent', 'AdaptiveGridSearch',
+           'SuccessiveHalving', 'Hyperband', 'DifferentialEvolution', 'CMAES',
+           'Racing', 'TrustRegion']
+__getattr__, __dir__ = lazy(__name__, {'Algorithm': '.algorithm',
+                                       'GridSearch': '.grid_search',
+                                       'GradientDescent': '.gradient_descent',
+                                       'AdaptiveGridSearch': '.adaptive_grid_search',
+                                       'SuccessiveHalving': '.successive_halving',
+                                       'Hyperband': '.successive_halving',
+                                       'DifferentialEvolution': '.differential_evolution',
+                                       'CMAES': '.cma_es',
+                                       'Racing': '.racing',
+                                       'TrustRegion': '.trust_region'})
@@ -0,0 +1,70 @@
+import heapq
+import itertools
+import numpy as np
+import attr
+from parametric import Attribute
+from optimistic.algorithms import GridSearch
+
+@attr.s
+class AdaptiveGridSearch(GridSearch):
+    ''' A multi-resolution grid search. The parameter space is first divided into
+        steps**dim cells, each measured at its center. Cells are then refined
+        quadtree/octree style, splitting into 2**dim children measured as one
+        batch, until the evaluation budget is spent.
+
+        The next cell to refine is the one with the lowest optimistic cost,
+        cost - exploration*variation, where variation is the spread of the
+        costs measured in the cell's family (its parent and siblings, or all
+        root cells). Small exploration values concentrate samples near the best
+        points found, while large values refine wherever the signal varies.
+
+        Arguments:
+            budget (int): maximum total number of evaluations, which must
+                          cover at least the steps**dim root cells.
+            exploration (float): weight of the variation in the refinement priority.
+            max_depth (int): maximum number of refinements of a root cell.
+    '''
+    steps = Attribute('steps', 3, converter=int)
+    budget = Attribute('budget', 200, converter=int)
+    exploration = Attribute('exploration', 1, converter=float)
+    max_depth = attr.ib(default=8, converter=int)
+
+    def divide(self, lower, upper, divisions):
+        ''' Splits the box between lower and upper into divisions**dim cells and
+            returns their lower and upper corners. '''
+        width = (upper - lower) / divisions
+        offsets = np.array(list(itertools.product(range(divisions), repeat=len(lower))))
+        lowers = lower + offsets*width
+        return lowers, lowers + width
+
+    def _run(self):
+        bounds = np.array([self.bounds[name] for name in self.parameters], dtype=float)
+        if self.steps()**len(bounds) > self.budget():
+            raise ValueError(f'The root grid of {self.steps()}**{len(bounds)} cells exceeds the budget of {self.budget()} evaluations.')
+        counter = itertools.count()
+        heap = []
+
+        def push(lowers, uppers, costs, depth, variation):
+            for lower, upper, cost in zip(lowers, uppers, costs):
+                priority = cost - self.exploration()*variation
+                heapq.heappush(heap, (priority, next(counter), lower, upper, cost, depth))
+
+        lowers, uppers = self.divide(bounds[:, 0], bounds[:, 1], self.steps())
+        costs = self.measure_batch((lowers + uppers) / 2)
+        evaluations = len(costs)
+        push(lowers, uppers, costs, 0, np.ptp(costs))
+
+        children = 2**len(bounds)
+        refinements = 0
+        while len(heap) > 0 and evaluations + children <= self.budget():
+            priority, index, lower, upper, cost, depth = heapq.heappop(heap)
+            if depth >= self.max_depth:
+                continue
+            lowers, uppers = self.divide(lower, upper, 2)
+            costs = self.measure_batch((lowers + uppers) / 2)
+            evaluations += len(costs)
+            push(lowers, uppers, costs, depth+1, np.ptp(np.append(costs, cost)))
+            self.notify('on_iteration', refinements)
+            refinements += 1
+            if self.converged():
+                return
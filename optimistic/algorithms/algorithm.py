@@ -1,12 +1,17 @@
 import numpy as np
-import pandas as pd
 import attr
 import time
-from tqdm.auto import tqdm
+import asyncio
+import threading
+import inspect
 from optimistic import experiment as objective
-from .plotting import Plotter
-from threading import Thread
-from ipywidgets import Text
+from .observations import Observations
+from .executors import get_executor
+from .log import ObservationLog
+from .profiler import Profiler
+from .scheduler import schedule
+from .statistics import PointStatistics
+from .handle import RunHandle
 from parametric import Parameter
 
 @attr.s
@@ -30,28 +35,85 @@ class Algorithm:
                           but previous results can be passed (along with results into
                           the y argument) to speed up some optimizers.
             y (1d array): objective function evaluations. Defaults to empty.
-            threaded (bool): if True, run optimization in a separate thread.
+                          X and y are stored in an Observations buffer, and the
+                          X and y attributes are views of its filled part.
+            threaded (bool): if True, run() starts the optimization in a separate
+                             thread and returns a RunHandle to monitor, pause or
+                             stop it.
             show_progress (bool): whether to display a progress bar during
                                   optimization. Adds <1 ms overhead per iteration.
             record_data (bool): whether to store X, y observations. Adds <1 ms overhead per iteration.
             display (bool): whether to display optimization status using ipywidgets.
                             Only works when running in a Jupyter environment.
+            display_interval (float): minimum time in seconds between updates of
+                                      the display. See also Plotter.live().
             continuous (bool): whether to quit after convergence/specified number of iterations
                                or continue running.
+            executor (Executor or str): optional executor used by measure_batch to
+                                        evaluate batches of points in parallel, e.g.
+                                        'thread', 'process' or 'dask'. Defaults to
+                                        measuring in the calling thread.
+            concurrency (int): maximum number of evaluations of an async experiment
+                               kept in flight by arun().
+            cache (EvaluationCache): optional cache of previous results. Points
+                                     found in the cache are not measured again.
+            log (ObservationLog): optional on-disk log to which every observation
+                                  is streamed, independently of record_data.
+            profiler (Profiler): per-phase timers, enabled by calling profile().
+            callbacks (dict): lists of functions called on events, indexed by
+                              event name; see add_callback().
+            delays (dict): actuation cost, e.g. settling time in seconds, indexed
+                           by Parameter name. Used to order batches of points.
+            order (str): if 'snake' or 'nearest', batches of points measured one
+                         at a time are reordered to reduce the total actuation
+                         cost (see optimistic.algorithms.scheduler).
+            lazy_actuation (bool): if True, measure() only actuates parameters whose
+                                   values differ from the previously measured point.
+            repeats (int): number of times each point is measured. The mean is
+                           recorded and returned, and the mean, variance and count
+                           of all shots at each point are kept in statistics.
+            statistics (PointStatistics): per-point statistics of repeated
+                                          measurements, created when repeats > 1.
+            stopping (list): stopping criteria from optimistic.algorithms.stopping,
+                             checked after each iteration. The run ends when any is
+                             met, and the reason is stored in stop_reason.
     '''
     experiment = attr.ib(default=None)
     parameters = attr.ib(factory=dict)
     bounds = attr.ib(factory=dict)
     points = attr.ib(factory=dict)        # optional overrides to search points
     sign = attr.ib(default=1, converter=np.sign)
-    X = attr.ib(factory=lambda: np.atleast_2d([]))
-    y = attr.ib(factory=lambda: np.array([]))
+    _X = attr.ib(factory=lambda: np.atleast_2d([]), repr=False, eq=False)
+    _y = attr.ib(factory=lambda: np.array([]), repr=False, eq=False)
+    observations = attr.ib(default=attr.Factory(lambda self: Observations(self._X, self._y), takes_self=True),
+                           init=False, repr=False, eq=False)
 
     threaded = attr.ib(default=False)
     show_progress = attr.ib(default=False)
     record_data = attr.ib(default=True)
     display = attr.ib(default=False)
+    display_interval = attr.ib(default=0.1, converter=float)
+    last_display = attr.ib(default=-np.inf, init=False, repr=False, eq=False)
+    pending = attr.ib(default=None, init=False, repr=False, eq=False)
     continuous = attr.ib(default=False)
+    executor = attr.ib(default=None, converter=get_executor)
+    concurrency = attr.ib(default=1, converter=int)
+    cache = attr.ib(default=None)
+    log = attr.ib(default=None)
+    profiler = attr.ib(default=None, repr=False)
+    callbacks = attr.ib(factory=dict, repr=False)
+    delays = attr.ib(factory=dict)
+    order = attr.ib(default=None)
+    lazy_actuation = attr.ib(default=False, converter=bool)
+    actuated = attr.ib(factory=dict, init=False, repr=False)
+    repeats = attr.ib(default=1, converter=int)
+    statistics = attr.ib(default=None, repr=False)
+    stopping = attr.ib(factory=list)
+    stop_reason = attr.ib(default=None, init=False)
+    best_cost = attr.ib(default=np.inf, init=False, repr=False)
+    evaluations = attr.ib(default=0, init=False, repr=False)
+    handle = attr.ib(default=None, init=False, repr=False, eq=False)
+    integrated_cost = attr.ib(default=0, init=False, repr=False)
 
     output = attr.ib(default=None)
 
@@ -84,13 +146,84 @@ class Algorithm:
         return self
 
     def check_bounds(self, point):
-        ''' Checks that the point is within the specified bounds '''
-        i = 0
-        for name, parameter in self.parameters.items():
+        ''' Checks that the point, or each row of a 2d array of points, is
+            within the specified bounds '''
+        points = np.atleast_2d(point)
+        for i, (name, parameter) in enumerate(self.parameters.items()):
             bounds = self.bounds[name]
-            if not bounds[0] <= point[i] <= bounds[1]:
+            if not np.all((bounds[0] <= points[:, i]) & (points[:, i] <= bounds[1])):
                 raise ValueError(f'The optimizer requested a point outside the valid bounds for parameter {parameter.name} and will now terminate.')
-            i += 1
+
+    def call(self, **new_values):
+        ''' Calls the experiment with the passed parameter values. For async
+            experiments, returns the awaitable result. '''
+        if isinstance(self.experiment, Parameter):
+            return objective(self.experiment)(optimizer=self, **new_values)  # manually wrap
+        return self.experiment(optimizer=self, **new_values)
+
+    def evaluate(self, **new_values):
+        ''' Calls the experiment with the passed parameter values, running async
+            experiments to completion. '''
+        result = self.call(**new_values)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+        return result
+
+    async def aevaluate(self, **new_values):
+        ''' Calls the experiment with the passed parameter values and awaits the
+            result of async experiments. '''
+        result = self.call(**new_values)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def restore(self, point):
+        ''' Actuates the parameters to the scalar values of a point, since a
+            vectorized experiment leaves them holding arrays of values, and
+            records them as actuated for lazy_actuation. '''
+        ignored = getattr(self.experiment, 'ignored', [])
+        for value, (name, parameter) in zip(point, self.parameters.items()):
+            if name not in ignored:
+                parameter(value)
+        self.actuated = dict(zip(self.parameters, point))
+
+    def schedule(self, points):
+        ''' Returns the order in which to measure a 2d array of points, following
+            self.order and self.delays. '''
+        if self.order is None:
+            return np.arange(len(points))
+        weights = [self.delays.get(name, 0) for name in self.parameters]
+        if not any(weights):
+            weights = np.ones(len(weights))
+        return schedule(points, self.order, weights)
+
+    def recall(self, points):
+        ''' Looks up a 2d array of points in the cache. Returns an array holding
+            the cached results and a mask of the points which must be measured. '''
+        results = np.empty(len(points))
+        missing = np.ones(len(points), dtype=bool)
+        if self.cache is not None:
+            for i, point in enumerate(points):
+                result = self.cache.get(point, self.parameters)
+                if result is not None:
+                    results[i] = result
+                    missing[i] = False
+        return results, missing
+
+    def tally(self, points, shots):
+        ''' Adds repeated measurements, a 2d array with one row of shots per
+            point, to the per-point statistics. '''
+        if self.statistics is None:
+            if self.repeats == 1:
+                return
+            self.statistics = PointStatistics()
+        self.statistics.update(points, shots)
+
+    def memoize(self, points, results):
+        ''' Stores measured results in the cache, if one is assigned. '''
+        if self.cache is not None:
+            for point, result in zip(np.atleast_2d(points), np.ravel(results)):
+                self.cache.put(point, self.parameters, result)
 
     def measure(self, point):
         ''' Actuate to specified point and measure result '''
@@ -99,37 +232,234 @@ class Algorithm:
 
         self.check_bounds(point)
 
-        new_values = {}
-        for i, (name, parameter) in enumerate(self.parameters.items()):
-            new_values[name] = point[i]
+        result = None
+        if self.cache is not None:
+            result = self.cache.get(point, self.parameters)
 
-        if isinstance(self.experiment, Parameter):
-            result = objective(self.experiment)(optimizer=self, **new_values)  # manually wrap
-        else:
-            result = self.experiment(optimizer=self, **new_values)
+        if result is None:
+            new_values = {}
+            for i, (name, parameter) in enumerate(self.parameters.items()):
+                if self.lazy_actuation and self.actuated.get(name) == point[i]:
+                    continue
+                new_values[name] = point[i]
 
-        if self.record_data:
-            if len(self.X[0]) == 0:
-                self.X = np.atleast_2d(point)
+            shots = [self.evaluate(**new_values)] + [self.evaluate() for i in range(self.repeats-1)]
+            result = shots[0] if self.repeats == 1 else np.mean(shots)
+            self.tally(point, [shots])
+            self.memoize(point, result)
+            if self.lazy_actuation:
+                self.actuated.update(new_values)
+
+        self.record(point, result)
+
+        self.show(point, result)
+
+        return -self.sign*result
+
+    def measure_batch(self, points):
+        ''' Measures a 2d array of points and returns the array of costs. If the
+            experiment was declared with @experiment(vectorized=True), the whole
+            batch is passed to it in one call; otherwise each point is measured
+            in turn. If an executor is assigned, the batch is split into chunks
+            which are evaluated in parallel on clones of the experiment owner;
+            serial and thread executors measure plain experiment functions here
+            as if no executor was assigned.
+        '''
+        if self.experiment is None:
+            raise ValueError('No experiment has been assigned to this optimizer!')
+
+        points = np.atleast_2d(points)
+        vectorized = getattr(self.experiment, 'vectorized', False)
+        executor = self.executor
+        if executor is not None and executor.local and not hasattr(self.experiment, '__self__'):
+            executor = None     # plain functions share their parameters with the caller
+        if executor is None and not vectorized:
+            order = self.schedule(points)
+            costs = np.empty(len(points))
+            for i in order:
+                costs[i] = self.measure(points[i])
+            return costs
+
+        self.check_bounds(points)
+        results, missing = self.recall(points)
+        if missing.any():
+            shots = np.repeat(points[missing], self.repeats, axis=0)
+            if executor is not None:
+                values = executor.evaluate(self.experiment, list(self.parameters), shots)
             else:
-                self.X = np.append(self.X, np.atleast_2d(point), axis=0)
-            self.y = np.append(self.y, result)
+                new_values = dict(zip(self.parameters, shots.T))
+                values = np.broadcast_to(self.evaluate(**new_values), len(shots))
+                self.restore(shots[-1])
+            values = np.asarray(values, dtype=float).reshape(-1, self.repeats)
+            self.tally(points[missing], values)
+            results[missing] = values.mean(axis=1)
+            self.memoize(points[missing], results[missing])
+
+        self.record(points, results)
+
+        self.show(points[-1], results[-1])
+
+        return -self.sign*results
+
+    async def ameasure(self, point):
+        ''' Asynchronous version of measure() '''
+        if self.experiment is None:
+            raise ValueError('No experiment has been assigned to this optimizer!')
+
+        self.check_bounds(point)
+
+        result = None
+        if self.cache is not None:
+            result = self.cache.get(point, self.parameters)
+
+        if result is None:
+            self.actuated = {}      # other evaluations may actuate while this one is awaited
+            new_values = dict(zip(self.parameters, point))
+            shots = [await self.aevaluate(**new_values) for i in range(self.repeats)]
+            result = shots[0] if self.repeats == 1 else np.mean(shots)
+            self.tally(point, [shots])
+            self.memoize(point, result)
+
+        self.record(point, result)
+
+        self.show(point, result)
+
+        return -self.sign*result
 
+    async def ameasure_batch(self, points):
+        ''' Asynchronous version of measure_batch(). Up to self.concurrency
+            evaluations are kept in flight, and results are recorded in the
+            order of the passed points. '''
+        if self.experiment is None:
+            raise ValueError('No experiment has been assigned to this optimizer!')
+
+        points = np.atleast_2d(points)
+        self.check_bounds(points)
+        results, missing = self.recall(points)
+        vectorized = getattr(self.experiment, 'vectorized', False)
+        if missing.any():
+            shots = np.repeat(points[missing], self.repeats, axis=0)
+            if vectorized:
+                new_values = dict(zip(self.parameters, shots.T))
+                values = np.broadcast_to(await self.aevaluate(**new_values), len(shots))
+                self.restore(shots[-1])
+            else:
+                self.actuated = {}
+                semaphore = asyncio.Semaphore(self.concurrency)
+
+                async def evaluate(point):
+                    async with semaphore:
+                        return await self.aevaluate(**dict(zip(self.parameters, point)))
+
+                values = await asyncio.gather(*[evaluate(point) for point in shots])
+            values = np.asarray(values, dtype=float).reshape(-1, self.repeats)
+            self.tally(points[missing], values)
+            results[missing] = values.mean(axis=1)
+        self.memoize(points[missing], results[missing])
+
+        self.record(points, results)
+
+        self.show(points[-1], results[-1])
+
+        return -self.sign*results
+
+    def record(self, points, results):
+        ''' Stores one or more observations in memory and in the log. '''
+        costs = -self.sign*np.asarray(results, dtype=float)
+        self.evaluations += costs.size
+        self.integrated_cost += costs.sum()
+        self.best_cost = min(self.best_cost, costs.min())
+        if self.record_data:
+            self.observations.extend(points, results)
+        if self.log is not None:
+            columns = list(self.parameters) + [self.experiment.__name__]
+            self.log.write(points, results, columns)
+        if 'on_measure' in self.callbacks:
+            self.notify('on_measure', points, results)
+
+    def add_callback(self, event, callback):
+        ''' Registers a function called as callback(algorithm, *args) on an event:
+                on_measure: after each measure or batch, with the point(s) and result(s)
+                on_iteration: on each step of range() or iterate(), with the index
+                on_block_end: after each block of a Pipeline, with the block
+                on_end: after a run ends
+        '''
+        if event not in ['on_measure', 'on_iteration', 'on_block_end', 'on_end']:
+            raise ValueError(f'Unknown event {event}.')
+        self.callbacks.setdefault(event, []).append(callback)
+
+    def notify(self, event, *args):
+        for callback in self.callbacks.get(event, []):
+            callback(self, *args)
+
+    def converged(self):
+        ''' Checks the stopping criteria and the run handle, storing the reason
+            if one is met. '''
+        if self.handle is not None and self.handle.checkpoint():
+            self.stop_reason = 'stopped'
+            return True
+        for criterion in self.stopping:
+            reason = criterion.check(self)
+            if reason is not None:
+                self.stop_reason = reason
+                return True
+        return False
+
+    def begin(self):
+        ''' Resets the per-run state before a run starts. '''
+        if self.handle is not None and self.handle.thread is not threading.current_thread():
+            self.handle = None      # left over from an earlier threaded run
+        self.actuated = {}
+        self.stop_reason = None
+        self.evaluations = 0
+        self.integrated_cost = 0
+        self.best_cost = np.min(-self.sign*self.y) if len(self.observations) > 0 else np.inf
+        for criterion in self.stopping:
+            criterion.reset(self)
+
+    def profile(self, trace=False):
+        ''' Enables per-phase timing of measurements on this instance and returns
+            the Profiler, e.g.
+                profiler = algorithm.profile()
+                algorithm.run()
+                profiler.summary()
+        '''
+        self.profiler = Profiler(trace=trace)
+        self.profiler.attach(self)
+        return self.profiler
+
+    def show(self, point, result):
+        ''' Displays the latest observation if self.display==True, at most once
+            per display_interval. Skipped observations are held until the next
+            update or the end of the run. '''
         if self.display:
+            now = time.perf_counter()
+            if now - self.last_display < self.display_interval:
+                self.pending = (point, result)
+                return
+            self.last_display = now
+            self.pending = None
             if self.output is None:
+                from ipywidgets import Text
                 self.output = Text()
                 display(self.output)
             self.output.value = str(point) + ' -> ' + str(result)
 
-        return -self.sign*result
+    @property
+    def X(self):
+        return self.observations.X
+
+    @property
+    def y(self):
+        return self.observations.y
 
     @property
     def dataset(self):
-        ''' If the optimizer is set to data_format = 'numpy', this converts acquired
-            data into a pandas.DataFrame.
-        '''
-        df = pd.DataFrame(self.X, columns = list(self.parameters.keys()))
-        df[self.experiment.__name__] = self.y
+        ''' Converts acquired data into a pandas.DataFrame. '''
+        import pandas as pd
+        X = self.observations.X if len(self.observations) > 0 else np.empty((0, len(self.parameters)))
+        df = pd.DataFrame(X, columns = list(self.parameters.keys()))
+        df[self.experiment.__name__] = self.observations.y
         return df
 
     @objective
@@ -137,27 +467,47 @@ class Algorithm:
         ''' Runs an optimization and returns the integrated cost as an objective
             function for meta-optimization. The @objective tag supports passing
             any of the optimizer parameters into the metacost evaluation.
+
+            The integrated cost is the sum of the costs measured during the run,
+            negated so that configurations which converge quickly score highest.
+            Meta-optimizers with an executor evaluate each configuration on an
+            independent clone of this optimizer, which requires the experiment
+            to be a method of a class containing its parameters. Clones share
+            any assigned cache (see SuccessiveHalving).
         '''
         # measure original coordinates
         original_coordinates = {}
         for p in self.parameters.values():
             original_coordinates[p.name] = p()
 
-        # run experiment and compute integral of objective function
-        self.data = pd.DataFrame()
-        self.run()
-        integrated_cost = self.data[self.experiment.__name__].sum()
-
-        # reset coordinates
-        for p in original_coordinates:
-            self.parameters[p](original_coordinates[p])
+        # run experiment, then reset coordinates
+        try:
+            self.run()
+        finally:
+            for p in original_coordinates:
+                self.parameters[p](original_coordinates[p])
 
-        return -integrated_cost
+        return -self.integrated_cost
 
     @property
     def plot(self):
+        from .plotting import Plotter
         return Plotter(self)
 
+    @classmethod
+    def resume(cls, path, experiment, **kwargs):
+        ''' Creates an algorithm from the ObservationLog at the passed path, with
+            the logged observations as X and y. New observations are appended
+            to the same log. If a cache is passed, it is seeded with the logged
+            points so that they are not measured again.
+        '''
+        log = ObservationLog(path)
+        X, y = log.read()
+        inst = cls(experiment, X=X, y=y, log=log, **kwargs)
+        if inst.cache is not None and log.columns is not None:
+            inst.cache.seed(X, y, log.columns[:-1])
+        return inst
+
     @classmethod
     def study(cls, experiment, parameter, bounds, **kwargs):
         ''' Launches a 1D optimization of the passed experiment with
@@ -179,11 +529,18 @@ class Algorithm:
             printed in order until execution is interrupted.
         '''
         if not self.continuous:
-            yield from range(1*iterations)
+            for i in range(1*iterations):
+                yield i
+                self.notify('on_iteration', i)
+                if self.converged():
+                    return
         else:
             i = 0
             while True:
                 yield i
+                self.notify('on_iteration', i)
+                if self.converged():
+                    return
                 i = (i+1) % 1*iterations
 
     def iterate(self, lst):
@@ -196,18 +553,60 @@ class Algorithm:
             If self.show_progress==True, returns a tqdm generator for displaying
             a progress bar.
         '''
-        if self.show_progress and not self.continuous:
-            yield from tqdm(lst)
-        elif not self.continuous:
-            yield from list(lst)
+        if not self.continuous:
+            if self.show_progress:
+                from tqdm.auto import tqdm
+                lst = tqdm(lst)
+            for i, x in enumerate(lst):
+                yield x
+                self.notify('on_iteration', i)
+                if self.converged():
+                    return
         else:
             i = 0
             while True:
                 yield lst[i]
+                self.notify('on_iteration', i)
+                if self.converged():
+                    return
                 i = (i+1) % len(lst)
 
     def run(self):
         if self.threaded:
-            Thread(target=self._run).start()
-        else:
+            self.handle = RunHandle(self)
+            return self.handle.start()
+        self.execute()
+
+    def execute(self):
+        ''' Runs the optimization, then writes any buffered observations to the log. '''
+        self.begin()
+        try:
             self._run()
+        finally:
+            self.end()
+
+    def end(self):
+        ''' Finishes a run: writes buffered observations to the log, shows the
+            last observation if the display skipped it, and notifies on_end. '''
+        if self.log is not None:
+            self.log.flush()
+        if self.pending is not None:
+            self.last_display = -np.inf
+            self.show(*self.pending)
+        self.notify('on_end')
+
+    async def arun(self):
+        ''' Runs the optimization in the current asyncio event loop, e.g.
+                await algorithm.arun()
+            Algorithms implementing _arun() keep up to self.concurrency
+            evaluations in flight; others are run in a worker thread so that
+            the event loop is not blocked.
+        '''
+        if not hasattr(self, '_arun'):
+            await asyncio.get_running_loop().run_in_executor(None, self.execute)
+            return
+        self.begin()
+        try:
+            await self._arun()
+        finally:
+            self.end()
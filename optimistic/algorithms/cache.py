@@ -0,0 +1,87 @@
+import numpy as np
+import threading
+from collections import OrderedDict
+
+class EvaluationCache:
+    ''' A memoizing cache of experiment results, keyed by the measured point
+        rounded to a per-parameter resolution. Points which round to the same key
+        are served from memory instead of being measured again.
+
+        Arguments:
+            resolution (float or dict): quantization step for each coordinate,
+                                        either shared or indexed by Parameter name.
+                                        Coordinates with resolution 0 (or missing
+                                        from the dict) must match exactly.
+            maxsize (int): maximum number of entries; the least recently used
+                           entry is evicted when full. Defaults to unbounded.
+
+        The cache is thread-safe, and deep copies return the same cache, so that
+        clones of an algorithm evaluated by a ThreadExecutor read and fill shared
+        entries. Caches sent to other processes are copied.
+    '''
+    def __init__(self, resolution=0, maxsize=None):
+        self.resolution = resolution
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, point, names):
+        point = np.asarray(point, dtype=float).ravel()
+        if isinstance(self.resolution, dict):
+            resolution = np.array([self.resolution.get(name, 0) for name in names], dtype=float)
+        else:
+            resolution = np.full(len(point), self.resolution, dtype=float)
+        quantized = np.where(resolution > 0, np.round(point / np.where(resolution > 0, resolution, 1)), point)
+        return tuple(quantized)
+
+    def get(self, point, names):
+        ''' Returns the cached result for the point, or None on a miss. '''
+        key = self.key(point, names)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, point, names, result):
+        key = self.key(point, names)
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            if self.maxsize is not None and len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def seed(self, X, y, names):
+        ''' Fills the cache from previous observations, e.g. Algorithm.X and Algorithm.y '''
+        for point, result in zip(np.atleast_2d(X), np.ravel(y)):
+            if np.size(point) > 0:
+                self.put(point, names, result)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self), 'maxsize': self.maxsize}
@@ -0,0 +1,73 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from .population import Population
+
+@attr.s
+class CMAES(Population):
+    ''' The covariance matrix adaptation evolution strategy (Hansen, 2016). Each
+        generation samples a multivariate normal distribution whose mean, step
+        size and covariance are adapted towards the best half of the previous
+        samples. The search runs in coordinates scaled so that the bounds map
+        to the unit cube, and samples are clipped to the bounds before being
+        measured and used in the update.
+
+        The mean starts from the best previous observation, the first of the
+        points argument, or the current parameter values, in that order.
+
+        Arguments:
+            sigma (float): initial step size as a fraction of the bounds.
+            population (int): number of samples per generation. Defaults to the
+                              usual 4 + 3 ln(dim).
+    '''
+    sigma = Attribute('sigma', 0.3, converter=float)
+    population = attr.ib(default=None)
+
+    def start(self):
+        ''' Returns the initial mean in scaled coordinates. '''
+        lower, upper = self.limits()
+        if len(self.observations) > 0:
+            x = self.X[np.argmin(-self.sign*self.y)]
+        elif len(self.parameters) > 0 and all(name in self.points for name in self.parameters):
+            x = np.array([np.ravel(self.points[name])[0] for name in self.parameters], dtype=float)
+        else:
+            x = np.array([p() for p in self.parameters.values()], dtype=float)
+        return (x - lower) / (upper - lower)
+
+    def _run(self):
+        lower, upper = self.limits()
+        n = len(lower)
+        lam = int(self.population) if self.population is not None else 4 + int(3*np.log(n))
+        mu = lam // 2
+        weights = np.log(mu + 0.5) - np.log(np.arange(1, mu+1))
+        weights /= weights.sum()
+        mueff = 1 / np.sum(weights**2)
+
+        cc = (4 + mueff/n) / (n + 4 + 2*mueff/n)
+        cs = (mueff + 2) / (n + mueff + 5)
+        c1 = 2 / ((n + 1.3)**2 + mueff)
+        cmu = min(1 - c1, 2*(mueff - 2 + 1/mueff) / ((n + 2)**2 + mueff))
+        damps = 1 + 2*max(0, np.sqrt((mueff - 1) / (n + 1)) - 1) + cs
+        chiN = np.sqrt(n) * (1 - 1/(4*n) + 1/(21*n**2))
+
+        mean = self.start()
+        sigma = self.sigma()
+        C = np.eye(n)
+        pc, ps = np.zeros(n), np.zeros(n)
+        for g in self.range(self.generations):
+            D2, B = np.linalg.eigh(C)
+            D = np.sqrt(np.clip(D2, 1e-20, None))
+            samples = np.clip(mean + sigma * self.rng.standard_normal((lam, n)) @ (B * D).T, 0, 1)
+            costs = self.measure_batch(lower + samples * (upper - lower))
+
+            steps = (samples[np.argsort(costs)[:mu]] - mean) / sigma
+            step = weights @ steps
+            mean = mean + sigma * step
+
+            ps = (1 - cs)*ps + np.sqrt(cs*(2 - cs)*mueff) * (B @ ((B.T @ step) / D))
+            hsig = np.linalg.norm(ps) / np.sqrt(1 - (1 - cs)**(2*(g + 1))) / chiN < 1.4 + 2/(n + 1)
+            pc = (1 - cc)*pc + hsig * np.sqrt(cc*(2 - cc)*mueff) * step
+            C = ((1 - c1 - cmu)*C + c1*(np.outer(pc, pc) + (1 - hsig)*cc*(2 - cc)*C)
+                 + cmu * (steps.T * weights) @ steps)
+            C = (C + C.T) / 2
+            sigma *= np.exp((cs / damps) * (np.linalg.norm(ps) / chiN - 1))
@@ -0,0 +1,40 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from .population import Population
+
+@attr.s
+class DifferentialEvolution(Population):
+    ''' Differential evolution (DE/rand/1/bin, Storn & Price 1997). Each member
+        of the population is challenged by a trial point, made by adding the
+        scaled difference of two random members to a third and crossing the
+        result with the member; the trial replaces the member if its cost is no
+        worse. Trials are clipped to the bounds.
+
+        Arguments:
+            mutation (float): scale factor F of the difference vector.
+            crossover (float): probability CR of taking each coordinate from the
+                               mutant rather than the member.
+    '''
+    mutation = Attribute('mutation', 0.8, converter=float)
+    crossover = Attribute('crossover', 0.9, converter=float)
+
+    def trials(self, points):
+        ''' Returns one trial point for each member of the population. '''
+        n, dim = points.shape
+        others = np.array([self.rng.choice(np.delete(np.arange(n), i), 3, replace=False) for i in range(n)])
+        a, b, c = points[others[:, 0]], points[others[:, 1]], points[others[:, 2]]
+        mutants = a + self.mutation() * (b - c)
+        crossed = self.rng.random((n, dim)) < self.crossover()
+        crossed[np.arange(n), self.rng.integers(dim, size=n)] = True
+        lower, upper = self.limits()
+        return np.clip(np.where(crossed, mutants, points), lower, upper)
+
+    def _run(self):
+        points, costs = self.initialize(max(self.population(), 4))
+        costs = self.evaluate_population(points, costs)
+        for i in self.range(self.generations):
+            trials = self.trials(points)
+            trial_costs = self.measure_batch(trials)
+            better = trial_costs <= costs
+            points[better], costs[better] = trials[better], trial_costs[better]
@@ -0,0 +1,119 @@
+''' Executors dispatch batches of experiment evaluations to a pool of workers.
+    Each executor splits a batch of points into one chunk per worker and sends
+    each chunk to experiment.evaluate_batch, which evaluates it on a single clone
+    of the experiment's owner. Pools are created on first use and reused across
+    runs until shutdown() is called.
+
+    Serial and thread executors run in the calling process, so plain experiment
+    functions, which have no owner to clone, are instead measured in turn by the
+    algorithm itself. Process and dask executors require a clonable owner.
+'''
+import attr
+import numpy as np
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from optimistic.experiment import evaluate_batch
+
+@attr.s
+class Executor:
+    ''' A base class for batch executors.
+
+        Arguments:
+            workers (int): number of workers in the pool.
+            chunksize (int): number of points submitted per task. Defaults to
+                             splitting each batch evenly across the workers.
+    '''
+    workers = attr.ib(default=1, converter=int)
+    chunksize = attr.ib(default=None)
+    local = True
+
+    def map(self, function, *iterables):
+        return list(map(function, *iterables))
+
+    def shutdown(self):
+        return
+
+    def chunks(self, points):
+        if self.chunksize is None:
+            n = min(self.workers, len(points))
+        else:
+            n = int(np.ceil(len(points) / self.chunksize))
+        return np.array_split(points, max(n, 1))
+
+    def evaluate(self, experiment, names, points):
+        ''' Evaluates the experiment at a 2d array of points and returns the
+            results in order. '''
+        chunks = self.chunks(points)
+        n = len(chunks)
+        results = self.map(evaluate_batch, [experiment]*n, [names]*n, chunks)
+        return np.concatenate([np.ravel(r) for r in results]).astype(float)
+
+@attr.s
+class SerialExecutor(Executor):
+    ''' Evaluates batches in the calling thread. '''
+
+@attr.s
+class ThreadExecutor(Executor):
+    ''' Evaluates chunks in a persistent thread pool. Suited to experiments which
+        release the GIL, e.g. by waiting on instruments or calling into NumPy. '''
+    workers = attr.ib(default=mp.cpu_count(), converter=int)
+    pool = attr.ib(default=None, repr=False)
+
+    def map(self, function, *iterables):
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self.pool.map(function, *iterables))
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+@attr.s
+class ProcessExecutor(ThreadExecutor):
+    ''' Evaluates chunks in a persistent process pool. The experiment owner must
+        be picklable. '''
+    local = False
+
+    def map(self, function, *iterables):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        return list(self.pool.map(function, *iterables))
+
+@attr.s
+class DaskExecutor(Executor):
+    ''' Evaluates chunks on a dask.distributed cluster. If no address is passed,
+        a local cluster is started on first use and kept until shutdown(). '''
+    workers = attr.ib(default=mp.cpu_count(), converter=int)
+    threads_per_worker = attr.ib(default=1, converter=int)
+    address = attr.ib(default=None)
+    client = attr.ib(default=None, repr=False)
+    local = False
+
+    def map(self, function, *iterables):
+        if self.client is None:
+            from dask.distributed import Client
+            if self.address is None:
+                self.client = Client(threads_per_worker=self.threads_per_worker, n_workers=self.workers)
+            else:
+                self.client = Client(self.address)
+        futures = self.client.map(function, *iterables, pure=False)
+        return self.client.gather(futures)
+
+    def shutdown(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+executors = {'serial': SerialExecutor,
+             'thread': ThreadExecutor,
+             'process': ProcessExecutor,
+             'dask': DaskExecutor}
+
+def get_executor(executor):
+    ''' Converts an executor name into a new instance of the matching class. '''
+    if isinstance(executor, str):
+        if executor not in executors:
+            raise ValueError(f'Unknown executor {executor}; choose from {list(executors)}.')
+        return executors[executor]()
+    return executor
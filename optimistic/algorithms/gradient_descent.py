@@ -5,26 +5,101 @@ from optimistic.algorithms import Algorithm
 
 @attr.s
 class GradientDescent(Algorithm):
+    ''' Gradient descent using finite difference estimates of the gradient. The
+        probe points of each estimate are measured as one batch, so they are
+        evaluated in parallel when an executor is assigned.
+
+        Arguments:
+            estimator (str): 'central' for central differences along each axis,
+                             costing 2*dim evaluations per step, or 'spsa' for
+                             simultaneous perturbation along random +/-1 directions,
+                             costing 2*spsa_samples evaluations regardless of dim.
+            spsa_samples (int): number of random directions averaged per SPSA estimate.
+            update (str): step rule; one of 'sgd', 'momentum' or 'adam'.
+            momentum (float): decay of the momentum or Adam first moment.
+            beta2 (float): decay of the Adam second moment.
+            seed (int): seed for the SPSA directions.
+    '''
     iterations = Attribute('iterations', 100, converter=int)
     learning_rate = Attribute('learning_rate', 1e-3, converter=float)
     dither_size = Attribute('dither_size', 1e-2, converter=float)
+    momentum = Attribute('momentum', 0.9, converter=float)
+    beta2 = Attribute('beta2', 0.999, converter=float)
+    estimator = attr.ib(default='central')
+    spsa_samples = attr.ib(default=1, converter=int)
+    update = attr.ib(default='sgd')
+    seed = attr.ib(default=None)
+    rng = attr.ib(default=attr.Factory(lambda self: np.random.default_rng(self.seed), takes_self=True),
+                  init=False, repr=False)
 
-    def gradient(self, x):
+    def directions(self):
+        ''' Returns the perturbation directions of one gradient estimate. '''
         dim = len(self.parameters)
-        g = np.zeros(dim)
-        for d in range(dim):
-            step = np.zeros(dim)
-            step[d] = self.dither_size()
+        if self.estimator == 'central':
+            return np.eye(dim)
+        if self.estimator == 'spsa':
+            return self.rng.choice([-1.0, 1.0], size=(self.spsa_samples, dim))
+        raise ValueError(f'Unknown gradient estimator {self.estimator}.')
+
+    def probes(self, x, directions):
+        ''' Returns the points x +/- dither_size*direction for each direction. '''
+        steps = directions * self.dither_size()
+        probes = np.empty((2*len(directions), len(self.parameters)))
+        probes[0::2] = x + steps
+        probes[1::2] = x - steps
+        return probes
+
+    def estimate(self, costs, directions):
+        ''' Combines the probe costs into a gradient estimate. Each SPSA slope is
+            divided elementwise by its +/-1 direction, which equals multiplying
+            by it, and the results are averaged. '''
+        slopes = (costs[0::2]-costs[1::2])/(2*self.dither_size)
+        if self.estimator == 'central':
+            return slopes
+        return slopes @ directions / len(directions)
+
+    def gradient(self, x):
+        ''' Estimates the gradient, measuring all probe points as one batch. '''
+        directions = self.directions()
+        return self.estimate(self.measure_batch(self.probes(x, directions)), directions)
+
+    async def agradient(self, x):
+        directions = self.directions()
+        return self.estimate(await self.ameasure_batch(self.probes(x, directions)), directions)
 
-            c1 = self.measure(x+step)
-            c2 = self.measure(x-step)
-            g[d] = (c1-c2)/(2*self.dither_size)
+    def step(self, g, t):
+        ''' Returns the parameter change for gradient g at iteration t. '''
+        if self.update == 'sgd':
+            return self.learning_rate * g
+        if self.update == 'momentum':
+            self.velocity = self.momentum() * self.velocity + g
+            return self.learning_rate * self.velocity
+        if self.update == 'adam':
+            self.velocity = self.momentum() * self.velocity + (1-self.momentum()) * g
+            self.second_moment = self.beta2() * self.second_moment + (1-self.beta2()) * g**2
+            m = self.velocity / (1 - self.momentum()**(t+1))
+            v = self.second_moment / (1 - self.beta2()**(t+1))
+            return self.learning_rate * m / (np.sqrt(v) + 1e-8)
+        raise ValueError(f'Unknown update rule {self.update}.')
 
-        return g
+    def reset(self):
+        self.last_gradient = None
+        self.velocity = np.zeros(len(self.parameters))
+        self.second_moment = np.zeros(len(self.parameters))
+        return np.array([p() for p in self.parameters.values()], dtype=float)
 
     def _run(self):
-        x_i = [p() for p in self.parameters.values()]
+        x_i = self.reset()
 
         for i in self.range(self.iterations):
-            x_i -= self.learning_rate * self.gradient(x_i)
+            self.last_gradient = self.gradient(x_i)
+            x_i -= self.step(self.last_gradient, i)
             self.measure(x_i)
+
+    async def _arun(self):
+        x_i = self.reset()
+
+        for i in self.range(self.iterations):
+            self.last_gradient = await self.agradient(x_i)
+            x_i -= self.step(self.last_gradient, i)
+            await self.ameasure(x_i)
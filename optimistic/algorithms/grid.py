@@ -0,0 +1,82 @@
+import math
+import numpy as np
+
+class Grid:
+    ''' A lazily indexed cartesian product of per-parameter sample points. Point
+        i is found by mixed-radix decoding of i, with the first parameter varying
+        slowest, so memory use is independent of the size of the grid.
+
+        Arguments:
+            axes (list): 1d arrays of sample points for each parameter.
+    '''
+    def __init__(self, axes):
+        self.axes = [np.asarray(axis, dtype=float) for axis in axes]
+        self.shape = tuple(len(axis) for axis in self.axes)
+        self.dim = len(self.axes)
+
+    def __len__(self):
+        return math.prod(self.shape)
+
+    def __getitem__(self, index):
+        ''' Returns the point at an integer index, or a 2d array of points for a
+            slice or array of indices. '''
+        if isinstance(index, slice):
+            index = np.arange(*index.indices(len(self)))
+        scalar = np.ndim(index) == 0
+        index = np.atleast_1d(np.asarray(index, dtype=np.int64))
+        if np.any(index < 0):
+            index = np.where(index < 0, index + len(self), index)
+        points = np.empty((len(index), self.dim))
+        for d in reversed(range(self.dim)):
+            index, digit = np.divmod(index, self.shape[d])
+            points[:, d] = self.axes[d][digit]
+        return points[0] if scalar else points
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def chunks(self, size=10000, start=0, stop=None):
+        ''' Yields the points with indices in [start, stop) as 2d arrays of up to
+            size rows. '''
+        stop = len(self) if stop is None else min(stop, len(self))
+        for i in range(start, stop, size):
+            yield self[i:min(i+size, stop)]
+
+    def shard(self, k, n):
+        ''' Returns the (start, stop) index range of the k-th of n equal shards. '''
+        return k*len(self)//n, (k+1)*len(self)//n
+
+    def shuffled(self, size=10000, seed=None):
+        ''' Yields every point once in a pseudorandom order as 2d arrays of up to
+            size rows. The order is an affine permutation i -> (a*i + b) mod N,
+            which needs no memory proportional to the grid. '''
+        N = len(self)
+        rng = np.random.default_rng(seed)
+        a = int(rng.integers(1, N)) if N > 1 else 1
+        while math.gcd(a, N) != 1:
+            a += 1
+        b = int(rng.integers(0, N))
+        dtype = np.int64 if N < 2**31 else object     # avoid overflow of a*i
+        for i in range(0, N, size):
+            index = np.arange(i, min(i+size, N)).astype(dtype)
+            yield self[np.array((a*index + b) % N, dtype=np.int64)]
+
+    def sample(self, n, method='random', seed=None):
+        ''' Returns n indices subsampled from the grid by one of the methods:
+                random: uniformly without replacement
+                latin: a Latin hypercube over the axes
+                sobol: a scrambled Sobol sequence over the axes
+        '''
+        rng = np.random.default_rng(seed)
+        if method == 'random':
+            return rng.choice(len(self), size=min(n, len(self)), replace=False)
+        if method == 'latin':
+            unit = (np.array([rng.permutation(n) for d in range(self.dim)]).T + rng.uniform(size=(n, self.dim))) / n
+        elif method == 'sobol':
+            from scipy.stats import qmc
+            unit = qmc.Sobol(self.dim, seed=rng).random(n)
+        else:
+            raise ValueError(f'Unknown sampling method {method}.')
+        digits = np.minimum((unit * self.shape).astype(np.int64), np.array(self.shape) - 1)
+        return np.ravel_multi_index(tuple(digits.T), self.shape)
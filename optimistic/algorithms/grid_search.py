@@ -1,23 +1,48 @@
 from optimistic.algorithms import Algorithm
 import numpy as np
 import attr
-import pandas as pd
-import dask
 import multiprocessing as mp
-from dask.distributed import Client
 from parametric import Attribute
+from .executors import DaskExecutor
+from .grid import Grid
 
 @attr.s
 class GridSearch(Algorithm):
+    ''' Measures the cartesian product of sample points for each parameter. The
+        grid is generated lazily and measured in chunks, so memory use does not
+        grow with the size of the grid.
+
+        Arguments:
+            steps (int): number of points per parameter, unless overridden by points.
+            scans (int): number of measurements averaged at each point; sets
+                         repeats (see Algorithm).
+            sampling (str): optional order or subsampling of the grid: 'shuffle'
+                            measures every point in a pseudorandom order, while
+                            'random', 'latin' and 'sobol' measure only a subsample
+                            of size samples (see Grid.sample).
+            samples (int): number of points measured when subsampling.
+            chunksize (int): number of points generated and measured per batch.
+            shard (tuple): optional (k, n) to measure only the k-th of n equal index
+                           ranges of the grid, e.g. on one of n machines.
+            seed (int): seed for shuffling and subsampling.
+    '''
     steps = Attribute('steps', 20, converter=int)
     scans = attr.ib(default=1, converter=int)
     parallel = attr.ib(default=False, converter=bool)
     threads_per_worker = attr.ib(default=1, converter=int)
     workers = attr.ib(default=mp.cpu_count(), converter=int)
     logarithmic = attr.ib(default=False, converter=bool)
+    sampling = attr.ib(default=None)
+    samples = attr.ib(default=100, converter=int)
+    chunksize = attr.ib(default=10000, converter=int)
+    shard = attr.ib(default=None)
+    seed = attr.ib(default=None)
 
-    def generate_grid(self):
-        dim = len(self.parameters)
+    def __attrs_post_init__(self):
+        self.repeats = max(self.repeats, self.scans)
+
+    def grid(self):
+        ''' Returns the lazily indexed Grid of points. '''
         grid = []
         for name, parameter in self.parameters.items():
             if name in self.points:
@@ -31,28 +56,82 @@ class GridSearch(Algorithm):
                     grid.append(np.linspace(self.bounds[name][0],
                                             self.bounds[name][1],
                                             self.steps()))
-        return np.transpose(np.meshgrid(*[grid[n] for n in range(dim)])).reshape(-1, dim)
+        return Grid(grid)
+
+    def generate_grid(self):
+        ''' Returns all points of the grid as a 2d array. '''
+        return self.grid()[:]
+
+    def chunks(self):
+        ''' Yields the points to measure as 2d arrays, following the sampling
+            and shard options. '''
+        grid = self.grid()
+        start, stop = (0, len(grid)) if self.shard is None else grid.shard(*self.shard)
+        if self.sampling is None:
+            yield from grid.chunks(self.chunksize, start, stop)
+        elif self.sampling == 'shuffle':
+            if self.shard is not None:
+                raise ValueError('Shuffled grids cannot be sharded.')
+            yield from grid.shuffled(self.chunksize, self.seed)
+        else:
+            index = grid.sample(self.samples, self.sampling, self.seed)
+            index = index[(index >= start) & (index < stop)]
+            for i in range(0, len(index), self.chunksize):
+                yield grid[index[i:i+self.chunksize]]
 
     def _run(self):
-        if self.parallel:
+        if self.parallel or self.executor is not None:
             self.run_parallel()
         else:
             self.run_sequential()
 
+    def scan(self, points):
+        ''' Measures a chunk of points in turn, checking the stopping criteria
+            and run handle after each one, and returns whether the run should
+            stop. Vectorized experiments measure the chunk in a single call, so
+            the criteria are checked once per chunk. '''
+        if getattr(self.experiment, 'vectorized', False):
+            self.measure_batch(points)
+            return self.converged()
+        for point in points[self.schedule(points)]:
+            self.measure(point)
+            if self.converged():
+                return True
+        return False
+
     def run_sequential(self):
-        points = self.generate_grid()
+        if not self.continuous and not self.show_progress:
+            for i, points in enumerate(self.chunks()):
+                stopped = self.scan(points)
+                self.notify('on_iteration', i)
+                if stopped:
+                    return
+            return
+        if self.order is None and self.sampling is None and self.shard is None:
+            points = self.grid()
+        else:
+            points = np.concatenate(list(self.chunks()))
+            points = points[self.schedule(points)]
         for point in self.iterate(points):
             self.measure(point)
 
+    async def _arun(self):
+        for i in self.range(1):
+            for points in self.chunks():
+                # check the criteria after each group of concurrent evaluations
+                size = len(points) if getattr(self.experiment, 'vectorized', False) else self.concurrency
+                for j in range(0, len(points), size):
+                    await self.ameasure_batch(points[j:j+size])
+                    if self.converged():
+                        return
+
     def run_parallel(self):
-        points = self.generate_grid()
-        points = pd.DataFrame(points, columns = list(self.parameters.keys()))
-        client = Client(threads_per_worker=self.threads_per_worker, n_workers=self.workers)
-        display(client)
-        futures = []
-        for values in points.values:
-            future = client.submit(self.experiment, parallel=True, optimizer=self, **dict(zip(self.parameters, values)))
-            futures.append(future)
-        results = client.gather(futures)
-        self.X = points
-        self.y = results
+        ''' Measures the grid as one batch through the assigned executor. If
+            parallel=True and no executor was assigned, a DaskExecutor is created
+            and kept for subsequent runs. '''
+        if self.executor is None:
+            self.executor = DaskExecutor(workers=self.workers, threads_per_worker=self.threads_per_worker)
+        for points in self.chunks():
+            self.measure_batch(points)
+            if self.converged():
+                return
@@ -0,0 +1,96 @@
+import threading
+from time import perf_counter
+
+class RunHandle:
+    ''' Controls an algorithm running in a background thread, and is returned by
+        Algorithm.run() when threaded=True. The algorithm checks the handle after
+        each iteration (see Algorithm.converged()), so stop() and pause() take
+        effect at the next iteration boundary, e.g. after each point measured
+        by a GridSearch or each step of a GradientDescent.
+
+        snapshot() copies the observations recorded so far without locking, so
+        a monitoring thread can poll a run without slowing it down.
+    '''
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.iterations = 0
+        self.exception = None
+        self.start_time = None
+        self.end_time = None
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self.thread = threading.Thread(target=self._target, daemon=True)
+
+    def _target(self):
+        try:
+            self.algorithm.execute()
+        except Exception as e:
+            self.exception = e
+        finally:
+            self.end_time = perf_counter()
+
+    def start(self):
+        self.start_time = perf_counter()
+        self.thread.start()
+        return self
+
+    def checkpoint(self):
+        ''' Counts an iteration, blocks while the run is paused, and returns
+            whether a stop was requested. Called from the running thread. '''
+        self.iterations += 1
+        self._resume.wait()
+        return self._stop.is_set()
+
+    def stop(self):
+        ''' Requests the run to end after the current iteration. '''
+        self._stop.set()
+        self._resume.set()
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def join(self, timeout=None):
+        ''' Waits for the run to end and returns whether it has. '''
+        self.thread.join(timeout)
+        return self.done
+
+    def result(self, timeout=None):
+        ''' Waits for the run to end and returns the algorithm, raising any
+            exception raised during the run. '''
+        if not self.join(timeout):
+            raise TimeoutError('The run did not finish within the timeout.')
+        if self.exception is not None:
+            raise self.exception
+        return self.algorithm
+
+    @property
+    def done(self):
+        return self.start_time is not None and not self.thread.is_alive()
+
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0
+        return (self.end_time or perf_counter()) - self.start_time
+
+    @property
+    def progress(self):
+        ''' Returns a dict of counters describing the run so far. '''
+        return {'iterations': self.iterations,
+                'evaluations': self.algorithm.evaluations,
+                'best_cost': self.algorithm.best_cost,
+                'elapsed': self.elapsed,
+                'paused': self.paused,
+                'done': self.done}
+
+    def snapshot(self):
+        ''' Returns copies of the (X, y) observations recorded so far. '''
+        return self.algorithm.observations.snapshot()
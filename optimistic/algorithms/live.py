@@ -0,0 +1,158 @@
+''' Streaming visualization of long or continuous runs. The summaries below hold
+    a fixed number of bins, consume only the observations recorded since their
+    last update, and are redrawn at most once per interval, so the cost of
+    plotting stays constant per measurement however long the run.
+'''
+import numpy as np
+from time import perf_counter
+
+class Trace:
+    ''' The min and max of a sequence of values in each of up to `bins` buckets
+        of consecutive values. When the buckets are full, neighbouring pairs are
+        merged and the bucket width doubles.
+    '''
+    def __init__(self, bins=512):
+        self.bins = bins - bins % 2
+        self.width = 1
+        self.count = 0
+        self.min = np.full(self.bins, np.inf)
+        self.max = np.full(self.bins, -np.inf)
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=float)
+        while len(values) > 0:
+            while self.count >= self.bins * self.width:
+                self.min = np.append(np.minimum(self.min[0::2], self.min[1::2]), np.full(self.bins//2, np.inf))
+                self.max = np.append(np.maximum(self.max[0::2], self.max[1::2]), np.full(self.bins//2, -np.inf))
+                self.width *= 2
+            n = min(len(values), self.bins*self.width - self.count)
+            index = (self.count + np.arange(n)) // self.width
+            np.minimum.at(self.min, index, values[:n])
+            np.maximum.at(self.max, index, values[:n])
+            self.count += n
+            values = values[n:]
+
+    def buckets(self):
+        ''' Returns the index of the first value in each filled bucket and the
+            bucket minima and maxima. '''
+        filled = -(-self.count // self.width)
+        return np.arange(filled) * self.width, self.min[:filled], self.max[:filled]
+
+class Histogram:
+    ''' Counts and the minimum cost of points in a fixed grid of bins over one or
+        two parameters within their bounds. '''
+    def __init__(self, bounds, bins=64):
+        self.edges = [np.linspace(lower, upper, bins+1) for lower, upper in bounds]
+        shape = (bins,) * len(bounds)
+        self.count = np.zeros(shape, dtype=int)
+        self.min = np.full(shape, np.inf)
+
+    def extend(self, points, costs):
+        index = tuple(np.clip(np.searchsorted(edges, points[:, i], side='right') - 1, 0, len(edges)-2)
+                      for i, edges in enumerate(self.edges))
+        np.add.at(self.count, index, 1)
+        np.minimum.at(self.min, index, costs)
+
+class LivePlot:
+    ''' Plots the convergence of an algorithm and its cost over up to two
+        parameters while it runs. Created by algorithm.plot.live(), which
+        registers update() to be called after each measurement.
+
+        Arguments:
+            algorithm (Algorithm): the algorithm to follow.
+            parameters (list): names of up to two parameters to histogram.
+                               Defaults to the first two.
+            interval (float): minimum time in seconds between redraws.
+            bins (int): number of buckets of the convergence trace and of
+                        the histogram along each parameter.
+    '''
+    def __init__(self, algorithm, parameters=None, interval=0.5, bins=512):
+        self.algorithm = algorithm
+        names = list(algorithm.parameters)
+        self.parameters = list(parameters or names[:2])
+        self.columns = [names.index(name) for name in self.parameters]
+        self.interval = interval
+        self.trace = Trace(bins)
+        self.best = Trace(bins)
+        self.best_cost = np.inf
+        self.histogram = Histogram([algorithm.bounds[name] for name in self.parameters], min(bins, 64))
+        self.seen = 0
+        self.last_draw = -np.inf
+        self.figure = None
+        self.handle = None
+
+    def consume(self):
+        ''' Adds the observations recorded since the previous call. '''
+        X, y = self.algorithm.X, self.algorithm.y
+        if len(y) <= self.seen:
+            return
+        X, y = X[self.seen:len(y)], y[self.seen:]
+        costs = -self.algorithm.sign * y
+        self.seen += len(y)
+        self.trace.extend(y)
+        best = np.minimum.accumulate(np.append(self.best_cost, costs))[1:]
+        self.best_cost = best[-1]
+        self.best.extend(-self.algorithm.sign * best)
+        self.histogram.extend(X[:, self.columns], costs)
+
+    def update(self, *args, force=False):
+        ''' Redraws if the interval has passed since the previous redraw. '''
+        now = perf_counter()
+        if not force and now - self.last_draw < self.interval:
+            return
+        self.last_draw = now
+        self.consume()
+        self.draw()
+
+    def draw(self):
+        import matplotlib.pyplot as plt
+        name = self.algorithm.experiment.__name__
+        if self.figure is None:
+            self.figure, (self.ax_trace, self.ax_space) = plt.subplots(1, 2, figsize=(10, 4))
+            self.ax_trace.set_xlabel('Iteration')
+            self.ax_trace.set_ylabel(name)
+            self.band = None
+            self.line, = self.ax_trace.plot([], [], 'k')
+            self.image = None
+        x, lower, upper = self.trace.buckets()
+        if self.band is not None:
+            self.band.remove()
+        self.band = self.ax_trace.fill_between(x, lower, upper, step='post', alpha=0.5, linewidth=0)
+        bx, low, high = self.best.buckets()
+        self.line.set_data(bx, low if self.algorithm.sign < 0 else high)
+        self.ax_trace.relim()
+        self.ax_trace.autoscale_view()
+
+        values = -self.algorithm.sign * np.where(self.histogram.count > 0, self.histogram.min, np.nan)
+        edges = self.histogram.edges
+        if len(edges) == 1:
+            self.ax_space.cla()
+            self.ax_space.stairs(values, edges[0])
+            self.ax_space.set_xlabel(self.parameters[0])
+            self.ax_space.set_ylabel(f'best {name}')
+        elif self.image is None:
+            self.image = self.ax_space.pcolormesh(edges[0], edges[1], values.T)
+            self.figure.colorbar(self.image, ax=self.ax_space, label=f'best {name}')
+            self.ax_space.set_xlabel(self.parameters[0])
+            self.ax_space.set_ylabel(self.parameters[1])
+        else:
+            self.image.set_array(values.T.ravel())
+            self.image.autoscale()
+        self.render()
+
+    def render(self):
+        ''' Pushes the figure to the notebook output if running in IPython, or
+            else asks an interactive backend to redraw. '''
+        try:
+            from IPython import get_ipython
+            notebook = get_ipython() is not None
+        except ImportError:
+            notebook = False
+        if not notebook:
+            self.figure.canvas.draw_idle()
+            return
+        from IPython.display import display
+        if self.handle is None:
+            self.handle = display(self.figure, display_id=True)
+        else:
+            self.handle.update(self.figure)
@@ -0,0 +1,86 @@
+import os
+import json
+import numpy as np
+
+class ObservationLog:
+    ''' An append-only binary log of observations on disk. The file starts with a
+        one-line JSON header naming the columns (parameters followed by the
+        experiment), followed by float64 rows. Rows are buffered in memory and
+        written in batches; a partially written row left by a crash is discarded
+        when the log is reopened.
+
+        Combined with record_data=False, attaching a log to an Algorithm keeps
+        memory bounded during long continuous runs. Algorithm.resume() builds a
+        new algorithm from a log to continue or warm-start a run.
+
+        Arguments:
+            path (str): location of the log file.
+            flush_every (int): number of rows to buffer before writing to disk.
+            sync (bool): whether to fsync after each write, guarding against
+                         losing buffered data on power loss as well as crashes.
+    '''
+    def __init__(self, path, flush_every=100, sync=False):
+        self.path = path
+        self.flush_every = int(flush_every)
+        self.sync = sync
+        self.columns = None
+        self.buffer = []
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.columns, offset = self.read_header()
+            row = 8 * len(self.columns)
+            size = os.path.getsize(path)
+            if (size - offset) % row:      # drop a row left partially written by a crash
+                os.truncate(path, size - (size - offset) % row)
+
+    def read_header(self):
+        with open(self.path, 'rb') as file:
+            header = file.readline()
+        return json.loads(header)['columns'], len(header)
+
+    def open(self, columns):
+        ''' Writes the header of a new log, or checks that an existing log has
+            the passed columns. '''
+        columns = list(columns)
+        if self.columns is None:
+            with open(self.path, 'wb') as file:
+                file.write((json.dumps({'columns': columns}) + '\n').encode())
+            self.columns = columns
+        elif self.columns != columns:
+            raise ValueError(f'The log at {self.path} records columns {self.columns}, not {columns}.')
+
+    def write(self, points, results, columns):
+        ''' Buffers a 2d array of points and their results for writing. '''
+        if self.columns is None:
+            self.open(columns)
+        rows = np.column_stack([np.atleast_2d(points), np.ravel(results)])
+        self.buffer.append(rows.astype(np.float64))
+        if sum(len(rows) for rows in self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if len(self.buffer) == 0:
+            return
+        with open(self.path, 'ab') as file:
+            file.write(np.concatenate(self.buffer).tobytes())
+            if self.sync:
+                file.flush()
+                os.fsync(file.fileno())
+        self.buffer = []
+
+    def read(self, mmap=False):
+        ''' Returns the logged (X, y) arrays, including buffered rows. If mmap is
+            True, rows on disk are memory-mapped rather than loaded. '''
+        if self.columns is None:
+            return np.atleast_2d([]), np.array([])
+        columns, offset = self.read_header()
+        width = len(columns)
+        rows = (os.path.getsize(self.path) - offset) // (8 * width)
+        if mmap and rows > 0:
+            data = np.memmap(self.path, dtype=np.float64, mode='r', offset=offset, shape=(rows, width))
+        else:
+            data = np.fromfile(self.path, dtype=np.float64, count=rows*width, offset=offset).reshape(rows, width)
+        if len(self.buffer) > 0:
+            data = np.concatenate([data] + self.buffer)
+        if len(data) == 0:
+            return np.atleast_2d([]), np.array([])
+        return data[:, :-1], data[:, -1]
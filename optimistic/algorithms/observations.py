@@ -0,0 +1,109 @@
+import numpy as np
+
+class Observations:
+    ''' An append-only store for the (X, y) observations recorded by an Algorithm.
+
+        Points and results are written into preallocated buffers which double
+        in capacity when full, so recording is O(1) amortized instead of the
+        O(N) copy incurred by np.append. The X and y properties return zero-copy
+        views of the filled part of the buffers. The version counter increases
+        with every change, so that derived data can be cached until it is stale.
+
+        Arguments:
+            X (2d array): optional previous coordinates to seed the store with.
+            y (1d array): optional previous objective function evaluations.
+            capacity (int): initial number of rows to allocate.
+    '''
+    def __init__(self, X=None, y=None, capacity=1024):
+        self.capacity = max(int(capacity), 1)
+        self._X = None
+        self._y = np.empty(self.capacity)
+        self._size = 0
+        self.version = 0
+        if X is not None and np.size(X) > 0:
+            self.extend(X, y)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dim(self):
+        ''' Number of coordinates per point, or None before the first record. '''
+        if self._X is None:
+            return None
+        return self._X.shape[1]
+
+    @property
+    def X(self):
+        if self._X is None:
+            return np.atleast_2d([])
+        return self._X[:self._size]
+
+    @property
+    def y(self):
+        return self._y[:self._size]
+
+    def snapshot(self):
+        ''' Returns copies of X and y which are consistent even while another
+            thread appends observations. The size is read before the buffers:
+            rows below it are never rewritten by append() or extend(), and are
+            copied into any reallocated buffer before it replaces the old one. '''
+        size = self._size
+        X, y = self._X, self._y
+        if X is None:
+            return np.atleast_2d([]), np.array([])
+        return X[:size].copy(), y[:size].copy()
+
+    def _reserve(self, rows, dim):
+        ''' Ensures that the buffers can hold the given number of additional rows. '''
+        if self._X is None:
+            self._X = np.empty((self.capacity, dim))
+        elif dim != self._X.shape[1]:
+            raise ValueError(f'Expected points with {self._X.shape[1]} coordinates, got {dim}.')
+
+        required = self._size + rows
+        if required <= self.capacity:
+            return
+        while self.capacity < required:
+            self.capacity *= 2
+        X = np.empty((self.capacity, dim))
+        X[:self._size] = self._X[:self._size]
+        y = np.empty(self.capacity)
+        y[:self._size] = self._y[:self._size]
+        self._X, self._y = X, y
+
+    def append(self, point, result):
+        ''' Records a single observation. '''
+        point = np.ravel(point)
+        self._reserve(1, len(point))
+        self._X[self._size] = point
+        self._y[self._size] = result
+        self._size += 1
+        self.version += 1
+
+    def extend(self, points, results):
+        ''' Records a batch of observations with a single copy. '''
+        points = np.atleast_2d(points)
+        results = np.ravel(results)
+        if len(points) != len(results):
+            raise ValueError('The number of points and results must match.')
+        self._reserve(len(points), points.shape[1])
+        self._X[self._size:self._size+len(points)] = points
+        self._y[self._size:self._size+len(points)] = results
+        self._size += len(points)
+        self.version += 1
+
+    def clear(self):
+        ''' Discards all observations while keeping the allocated buffers. '''
+        self._size = 0
+        self.version += 1
+
+    def keep(self, mask):
+        ''' Discards the observations where the boolean mask is False, compacting
+            the rest in place without reallocating the buffers. '''
+        index = np.flatnonzero(mask)
+        if self._X is not None:
+            self._X[:len(index)] = self._X[index]
+        self._y[:len(index)] = self._y[index]
+        self._size = len(index)
+        self.version += 1
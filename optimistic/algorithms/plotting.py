@@ -1,19 +1,44 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+from functools import partial
 
 class Plotter:
     def __init__(self, algorithm):
-        self.data = algorithm.dataset
+        self.algorithm = algorithm
+        self.observations = algorithm.observations
+        self.parameters = list(algorithm.parameters.keys())
         self.experiment = algorithm.experiment
+        self._data = None
+
+    @property
+    def data(self):
+        ''' Builds the DataFrame view of the observations on first access. '''
+        if self._data is None:
+            self._data = pd.DataFrame(self.observations.X, columns=self.parameters)
+            self._data[self.experiment.__name__] = self.observations.y
+        return self._data
+
+    def live(self, parameters=None, interval=0.5, bins=512):
+        ''' Returns a LivePlot which follows the run as it measures, drawing a
+            decimated convergence trace and a histogram of the best cost over
+            up to two parameters at most once per interval seconds, and once
+            more when the run ends. '''
+        from .live import LivePlot
+        live = LivePlot(self.algorithm, parameters, interval, bins)
+        self.algorithm.add_callback('on_measure', live.update)
+        self.algorithm.add_callback('on_end', partial(live.update, force=True))
+        return live
 
     def convergence(self):
-        self.data[self.experiment.__name__].plot()
+        plt.plot(self.observations.y)
         plt.xlabel('Iteration')
         plt.ylabel(self.experiment.__name__)
 
     def parameter_space(self, parameter):
         ''' Pass up to two parameters to visualize the parameter space of the objective function '''
-        plt.plot(self.data[parameter.name], self.data[self.experiment.__name__], '.')
+        i = self.parameters.index(parameter.name)
+        plt.plot(self.observations.X[:, i], self.observations.y, '.')
         plt.xlabel(parameter.name)
         plt.ylabel(self.experiment.__name__)
 
@@ -0,0 +1,53 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from optimistic.algorithms import Algorithm
+
+@attr.s
+class Population(Algorithm):
+    ''' A base class for population-based algorithms. Each generation is measured
+        as one batch with measure_batch(), so it is evaluated in parallel when an
+        executor is assigned, or in one call for vectorized experiments.
+
+        The initial population is taken from the points argument if one is given
+        for every parameter; otherwise it is seeded with the best previous
+        observations in X and y, and filled with random points within the bounds.
+
+        Arguments:
+            generations (int): number of generations to run.
+            population (int): number of points per generation.
+            seed (int): seed for random number generation.
+    '''
+    generations = Attribute('generations', 100, converter=int)
+    population = Attribute('population', 20, converter=int)
+    seed = attr.ib(default=None)
+    rng = attr.ib(default=attr.Factory(lambda self: np.random.default_rng(self.seed), takes_self=True),
+                  init=False, repr=False)
+
+    def limits(self):
+        ''' Returns the lower and upper bounds as arrays. '''
+        bounds = np.array([self.bounds[name] for name in self.parameters], dtype=float)
+        return bounds[:, 0], bounds[:, 1]
+
+    def initialize(self, size):
+        ''' Returns the initial population and its costs, which are NaN for points
+            not yet measured. '''
+        if len(self.parameters) > 0 and all(name in self.points for name in self.parameters):
+            points = np.column_stack([np.ravel(self.points[name]) for name in self.parameters])
+            return points.astype(float), np.full(len(points), np.nan)
+        points = np.empty((0, len(self.parameters)))
+        costs = np.empty(0)
+        if len(self.observations) > 0:
+            best = np.argsort(-self.sign*self.y)[:size]
+            points, costs = self.X[best], -self.sign*self.y[best]
+        lower, upper = self.limits()
+        fill = self.rng.uniform(lower, upper, (size-len(points), len(lower)))
+        return np.append(points, fill, axis=0), np.append(costs, np.full(len(fill), np.nan))
+
+    def evaluate_population(self, points, costs):
+        ''' Measures the points whose costs are NaN. '''
+        missing = np.isnan(costs)
+        if missing.any():
+            costs = costs.copy()
+            costs[missing] = self.measure_batch(points[missing])
+        return costs
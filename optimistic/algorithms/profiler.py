@@ -0,0 +1,101 @@
+import json
+import threading
+from time import perf_counter
+from functools import wraps
+from collections import defaultdict
+
+class Profiler:
+    ''' Accumulates per-phase timings of an Algorithm's measurements. Created by
+        Algorithm.profile(), which wraps the hot-path methods of that instance
+        only, so algorithms without a profiler pay no cost.
+
+        Phases:
+            measure: a full call to measure() or ameasure().
+            batch: a full call to measure_batch() or ameasure_batch().
+            bounds: bounds checks.
+            actuate: setting Parameter values in the experiment wrapper.
+            objective: the experiment function itself, including the await
+                       of async experiments.
+            record: storing observations in memory and in the log.
+            display: updating the ipywidgets display.
+
+        Arguments:
+            trace (bool): whether to keep every timed event for export with
+                          save_trace(), in addition to the totals.
+    '''
+    methods = {'measure': 'measure',
+               'measure_batch': 'batch',
+               'check_bounds': 'bounds',
+               'record': 'record',
+               'show': 'display'}
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.events = []
+        self.origin = perf_counter()
+
+    def add(self, phase, start, end=None):
+        ''' Records a phase which ran from start until end (default now), and
+            returns the end time so that consecutive phases can be chained. '''
+        if end is None:
+            end = perf_counter()
+        self.totals[phase] += end - start
+        self.calls[phase] += 1
+        if self.trace:
+            self.events.append((phase, start, end, threading.get_ident()))
+        return end
+
+    def timed(self, phase, method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.add(phase, start)
+        return wrapper
+
+    def timed_async(self, phase, method):
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self.add(phase, start)
+        return wrapper
+
+    def attach(self, algorithm):
+        ''' Wraps the hot-path methods of an algorithm instance with timers. '''
+        for name, phase in self.methods.items():
+            setattr(algorithm, name, self.timed(phase, getattr(algorithm, name)))
+        algorithm.ameasure = self.timed_async('measure', algorithm.ameasure)
+        algorithm.ameasure_batch = self.timed_async('batch', algorithm.ameasure_batch)
+
+    def summary(self):
+        ''' Returns a pandas.DataFrame of calls, total and mean time per phase,
+            and each phase's share of the wall time since profiling started. '''
+        import pandas as pd
+        df = pd.DataFrame({'calls': pd.Series(self.calls, dtype=int),
+                           'total': pd.Series(self.totals, dtype=float)})
+        df['mean'] = df['total'] / df['calls']
+        df['fraction'] = df['total'] / (perf_counter() - self.origin)
+        df.index.name = 'phase'
+        return df.sort_values('total', ascending=False)
+
+    def save_trace(self, path):
+        ''' Writes the recorded events in the Chrome trace event format, which can
+            be opened in chrome://tracing or Perfetto. '''
+        events = [{'name': phase, 'ph': 'X', 'pid': 0, 'tid': thread,
+                   'ts': (start - self.origin)*1e6, 'dur': (end - start)*1e6}
+                  for phase, start, end, thread in self.events]
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events}, file)
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+        self.events = []
+        self.origin = perf_counter()
@@ -0,0 +1,56 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from optimistic.algorithms import GridSearch
+from .statistics import PointStatistics
+
+@attr.s
+class Racing(GridSearch):
+    ''' Finds the best of the grid points of a noisy experiment by racing. Every
+        candidate is first measured shots times. Candidates whose confidence
+        interval of the mean cost lies entirely above that of the best candidate
+        are then eliminated, and the survivors are measured shots more times
+        each, until one candidate is left or the budget is spent. Repeats are
+        thus only spent on candidates whose ranking is still uncertain.
+
+        The candidate with the lowest mean cost is stored in best, and the mean,
+        variance and count of every candidate in statistics. Assigning a cache
+        would serve repeated shots from memory, so it should not be used.
+
+        Arguments:
+            shots (int): number of shots per candidate in each round; at least 2.
+            confidence (float): half-width of the confidence intervals in
+                                standard errors.
+            budget (int): maximum total number of shots.
+    '''
+    shots = Attribute('shots', 3, converter=int)
+    confidence = Attribute('confidence', 2, converter=float)
+    budget = Attribute('budget', 1000, converter=int)
+    best = attr.ib(default=None, init=False)
+
+    def interval(self, points):
+        ''' Returns the mean cost and the half-width of its confidence interval. '''
+        mean, variance, count = self.statistics.get(points)
+        return -self.sign*mean, self.confidence() * np.sqrt(variance / count)
+
+    def _run(self):
+        self.statistics = PointStatistics()
+        candidates = np.concatenate(list(self.chunks()))
+        shots = max(self.shots(), 2)
+        self.measure_batch(np.repeat(candidates, shots, axis=0))
+
+        i = 0
+        while len(candidates) > 1:
+            cost, error = self.interval(candidates)
+            best = np.argmin(cost)
+            candidates = candidates[cost - error <= cost[best] + error[best]]
+            self.notify('on_iteration', i)
+            i += 1
+            if len(candidates) == 1 or self.converged():
+                break
+            if self.statistics.shots + len(candidates)*shots*self.repeats > self.budget():
+                break
+            self.measure_batch(np.repeat(candidates, shots, axis=0))
+
+        cost, error = self.interval(candidates)
+        self.best = candidates[np.argmin(cost)]
@@ -0,0 +1,64 @@
+''' Point schedulers reorder a batch of points to reduce the cost of actuating
+    between them. Each scheduler takes a 2d array of points and per-parameter
+    weights, such as settling delays in seconds, and returns the permutation in
+    which the points should be measured.
+'''
+import numpy as np
+
+def snake(points, weights=None):
+    ''' Boustrophedon order: points are sorted with the most expensive parameter
+        outermost, and each inner parameter reverses direction whenever an outer
+        parameter steps, so consecutive points of a grid differ in only one
+        parameter. '''
+    points = np.atleast_2d(points)
+    dim = points.shape[1]
+    if weights is None:
+        weights = np.zeros(dim)
+    priority = np.argsort(-np.asarray(weights, dtype=float), kind='stable')
+
+    position = np.zeros(len(points), dtype=np.int64)     # traversal index of the outer parameters
+    for d in priority:
+        values, index = np.unique(points[:, d], return_inverse=True)
+        n = len(values)
+        position = position*n + np.where(position % 2 == 0, index, n-1-index)
+    return np.argsort(position, kind='stable')
+
+def transition_costs(point, points, weights):
+    ''' Cost of moving from point to each of points: the summed weights of the
+        parameters which change, plus a small distance term to break ties. '''
+    changed = points != point
+    distance = np.abs(points - point).sum(axis=1)
+    return changed @ weights + 1e-9*distance
+
+def nearest_neighbour(points, weights=None, start=0):
+    ''' Greedy tour which always moves to the cheapest unvisited point. Costs
+        O(n^2) for n points, so is suited to batches rather than large grids. '''
+    points = np.atleast_2d(points)
+    if weights is None:
+        weights = np.ones(points.shape[1])
+    weights = np.asarray(weights, dtype=float)
+    unvisited = np.ones(len(points), dtype=bool)
+    order = np.empty(len(points), dtype=np.int64)
+    current = start
+    for i in range(len(points)):
+        order[i] = current
+        unvisited[current] = False
+        if i == len(points) - 1:
+            break
+        candidates = np.flatnonzero(unvisited)
+        current = candidates[np.argmin(transition_costs(points[current], points[candidates], weights))]
+    return order
+
+schedulers = {'snake': snake, 'nearest': nearest_neighbour}
+
+def schedule(points, method, weights=None):
+    ''' Returns the permutation of points given by the named scheduler. '''
+    if method not in schedulers:
+        raise ValueError(f'Unknown scheduler {method}; choose from {list(schedulers)}.')
+    return schedulers[method](points, weights)
+
+def actuation_cost(points, weights):
+    ''' Total cost of actuating through the points in order. '''
+    points = np.atleast_2d(points)
+    changed = points[1:] != points[:-1]
+    return float(np.sum(changed @ np.asarray(weights, dtype=float)))
@@ -0,0 +1,47 @@
+import numpy as np
+
+class PointStatistics:
+    ''' The running mean, variance and count of the results measured at each
+        distinct point, for noisy experiments measured repeatedly. Batches of
+        shots are merged with the parallel form of Welford's algorithm, so the
+        shots themselves are not stored.
+    '''
+    def __init__(self):
+        self.entries = {}
+        self.shots = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def update(self, points, shots):
+        ''' Adds a 2d array of shots, with one row per point in the 2d array points. '''
+        shots = np.atleast_2d(np.asarray(shots, dtype=float))
+        n = shots.shape[1]
+        means = shots.mean(axis=1)
+        m2s = ((shots - means[:, None])**2).sum(axis=1)
+        for point, mean, m2 in zip(np.atleast_2d(points), means, m2s):
+            key = tuple(np.asarray(point, dtype=float))
+            count, old_mean, old_m2 = self.entries.get(key, (0, 0.0, 0.0))
+            total = count + n
+            delta = mean - old_mean
+            self.entries[key] = (total, old_mean + delta*n/total, old_m2 + m2 + delta**2*count*n/total)
+        self.shots += shots.size
+
+    def get(self, points):
+        ''' Returns arrays of the mean, sample variance and count at each of a 2d
+            array of points. The variance is NaN for points with a single shot. '''
+        stats = np.array([self.entries.get(tuple(np.asarray(point, dtype=float)), (0, np.nan, np.nan))
+                          for point in np.atleast_2d(points)])
+        count, mean, m2 = stats.T
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = np.where(count > 1, m2 / (count - 1), np.nan)
+        return mean, variance, count.astype(int)
+
+    def frame(self, columns):
+        ''' Returns a pandas.DataFrame with one row per point, indexed by the
+            passed coordinate names. '''
+        import pandas as pd
+        points = np.array(list(self.entries), dtype=float).reshape(-1, len(columns))
+        mean, variance, count = self.get(points)
+        index = pd.MultiIndex.from_arrays(points.T, names=list(columns))
+        return pd.DataFrame({'mean': mean, 'variance': variance, 'count': count}, index=index)
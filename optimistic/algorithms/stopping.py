@@ -0,0 +1,85 @@
+''' Stopping criteria end a run early once further evaluations are unlikely to
+    help. Algorithms check their criteria after each iteration (see
+    Algorithm.converged()), and store the reason for stopping in stop_reason.
+    Each criterion tracks the best cost found so far, Algorithm.best_cost, as
+    seen at successive checks.
+'''
+import attr
+import time
+import numpy as np
+
+@attr.s
+class Criterion:
+    def reset(self, algorithm):
+        ''' Clears any state at the start of a run. '''
+        self.history = []
+
+    def check(self, algorithm):
+        ''' Returns a description of why the run should stop, or None. '''
+        return None
+
+@attr.s
+class Tolerance(Criterion):
+    ''' Stops when the best cost improved by less than tol over the last window checks. '''
+    tol = attr.ib(default=1e-6, converter=float)
+    window = attr.ib(default=10, converter=int)
+
+    def check(self, algorithm):
+        self.history.append(algorithm.best_cost)
+        if len(self.history) > self.window:
+            improvement = self.history[-self.window-1] - self.history[-1]
+            if improvement < self.tol:
+                return f'best cost improved by {improvement:.3g} < {self.tol:.3g} in {self.window} iterations'
+
+@attr.s
+class Stall(Criterion):
+    ''' Stops when the best cost has not changed for the given number of checks. '''
+    iterations = attr.ib(default=20, converter=int)
+
+    def reset(self, algorithm):
+        self.best = np.inf
+        self.stalled = 0
+
+    def check(self, algorithm):
+        if algorithm.best_cost < self.best:
+            self.best = algorithm.best_cost
+            self.stalled = 0
+        else:
+            self.stalled += 1
+        if self.stalled >= self.iterations:
+            return f'best cost unchanged for {self.iterations} iterations'
+
+@attr.s
+class GradientNorm(Criterion):
+    ''' Stops when the norm of the latest gradient estimate is below tol. Only
+        applies to algorithms which estimate gradients, e.g. GradientDescent. '''
+    tol = attr.ib(default=1e-6, converter=float)
+
+    def check(self, algorithm):
+        gradient = getattr(algorithm, 'last_gradient', None)
+        if gradient is not None and np.linalg.norm(gradient) < self.tol:
+            return f'gradient norm below {self.tol:.3g}'
+
+@attr.s
+class Budget(Criterion):
+    ''' Stops after a number of evaluations and/or seconds since the run started. '''
+    evaluations = attr.ib(default=None)
+    seconds = attr.ib(default=None)
+
+    def reset(self, algorithm):
+        self.start = time.perf_counter()
+
+    def check(self, algorithm):
+        if self.evaluations is not None and algorithm.evaluations >= self.evaluations:
+            return f'evaluation budget of {self.evaluations} reached'
+        if self.seconds is not None and time.perf_counter() - self.start >= self.seconds:
+            return f'time budget of {self.seconds} s reached'
+
+@attr.s
+class Target(Criterion):
+    ''' Stops once the best cost is at or below a target value. '''
+    cost = attr.ib(default=0, converter=float)
+
+    def check(self, algorithm):
+        if algorithm.best_cost <= self.cost:
+            return f'target cost {self.cost:.3g} reached'
@@ -0,0 +1,107 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from optimistic.algorithms import Algorithm
+from .stopping import Budget
+
+@attr.s
+class SuccessiveHalving(Algorithm):
+    ''' Meta-optimization by successive halving. The experiment should be the
+        metacost of another algorithm, whose hyperparameters are added as the
+        parameters of this one, e.g.
+            meta = SuccessiveHalving(gd.metacost, logarithmic=True)
+            meta.add_parameter(gd.learning_rate, bounds=(1e-4, 1e-1))
+
+        Random configurations are first run with a budget of min_evaluations
+        measurements of the inner experiment. The best 1/eta of them are run
+        again with eta times the budget, and so on until one configuration is
+        left, so that poor configurations are terminated early. Each round is
+        measured as one batch, which an executor evaluates in parallel on clones
+        of the inner algorithm. Assigning a cache to the inner algorithm lets
+        reruns replay the start of their trajectories from memory.
+
+        The surviving configuration is stored in best.
+
+        Arguments:
+            configurations (int): number of configurations sampled initially.
+            min_evaluations (int): inner evaluation budget of the first round.
+            max_evaluations (int): optional cap on the inner evaluation budget.
+            eta (float): factor by which each round cuts the configurations and
+                         grows the budget.
+            logarithmic (bool): whether to sample configurations uniformly in
+                                the logarithm of the bounds.
+            seed (int): seed for sampling configurations.
+    '''
+    configurations = Attribute('configurations', 27, converter=int)
+    min_evaluations = attr.ib(default=10, converter=int)
+    max_evaluations = attr.ib(default=None)
+    eta = Attribute('eta', 3, converter=float)
+    logarithmic = attr.ib(default=False, converter=bool)
+    seed = attr.ib(default=None)
+    rng = attr.ib(default=attr.Factory(lambda self: np.random.default_rng(self.seed), takes_self=True),
+                  init=False, repr=False)
+    best = attr.ib(default=None, init=False)
+
+    def sample(self, n):
+        ''' Returns n random configurations within the bounds. '''
+        bounds = np.array([self.bounds[name] for name in self.parameters], dtype=float)
+        if self.logarithmic:
+            bounds = np.log10(bounds)
+        points = self.rng.uniform(bounds[:, 0], bounds[:, 1], size=(n, len(bounds)))
+        return 10**points if self.logarithmic else points
+
+    def rung(self, points, evaluations):
+        ''' Measures each configuration with the inner algorithm limited to the
+            passed number of evaluations. '''
+        inner = getattr(self.experiment, '__self__', None)
+        if not isinstance(inner, Algorithm):
+            raise ValueError('The experiment must be the metacost of an Algorithm.')
+        stopping = inner.stopping
+        inner.stopping = stopping + [Budget(evaluations=evaluations)]
+        try:
+            return self.measure_batch(points)
+        finally:
+            inner.stopping = stopping
+
+    def halve(self, points, evaluations):
+        ''' Runs successive halving from the passed configurations and initial
+            budget, and returns the survivor with its cost. '''
+        while True:
+            costs = self.rung(points, evaluations)
+            self.notify('on_iteration', evaluations)
+            if len(points) == 1 or evaluations == self.max_evaluations or self.converged():
+                break
+            survivors = max(1, int(len(points) / self.eta()))
+            order = np.argsort(costs)[:survivors]
+            points, costs = points[order], costs[order]
+            evaluations = int(np.ceil(evaluations * self.eta()))
+            if self.max_evaluations is not None:
+                evaluations = min(evaluations, int(self.max_evaluations))
+        best = np.argmin(costs)
+        return points[best], costs[best]
+
+    def _run(self):
+        self.best, cost = self.halve(self.sample(self.configurations()), self.min_evaluations)
+
+@attr.s
+class Hyperband(SuccessiveHalving):
+    ''' Runs successive halving in several brackets which trade the number of
+        configurations against their initial budget, from many configurations
+        starting at min_evaluations to a few run with max_evaluations from the
+        start (Li et al., 2018). This hedges against hyperparameters whose
+        effect only shows late in a run. The configurations argument is unused,
+        and the best of the survivors of each bracket is stored in best.
+    '''
+    max_evaluations = attr.ib(default=810, converter=int)
+
+    def _run(self):
+        eta = self.eta()
+        brackets = int(np.log(self.max_evaluations / self.min_evaluations) / np.log(eta) + 1e-9)
+        best_cost = np.inf
+        for s in range(brackets, -1, -1):
+            n = int(np.ceil((brackets+1) / (s+1) * eta**s))
+            point, cost = self.halve(self.sample(n), int(self.max_evaluations / eta**s))
+            if cost < best_cost:
+                self.best, best_cost = point, cost
+            if self.stop_reason is not None:
+                break
@@ -0,0 +1,155 @@
+import numpy as np
+import attr
+from parametric import Attribute
+from optimistic.algorithms import Algorithm
+
+@attr.s
+class TrustRegion(Algorithm):
+    ''' A derivative-free trust-region method for expensive experiments. Each
+        iteration fits a quadratic model by least squares to all previous
+        observations near the current center, minimizes it within a box of the
+        trust radius and measures the minimizer. The step is accepted if it
+        improves the cost, and the radius grows when the model predicted the
+        improvement well and shrinks when it did not.
+
+        The model is linear until 2*dim+1 nearby points are known, then has a
+        diagonal Hessian, and a full Hessian from (dim+1)(dim+2)/2 points, so
+        most iterations cost a single evaluation. Past observations in X and y,
+        including those passed in when creating the algorithm, are reused, and
+        the search starts from the best of them or else the current parameter
+        values. The search runs in coordinates scaled so that the bounds map to
+        the unit cube. Requires record_data=True.
+
+        Arguments:
+            iterations (int): maximum number of iterations.
+            radius (float): initial trust radius as a fraction of the bounds.
+            min_radius (float): radius below which the search has converged.
+            max_radius (float): largest allowed radius.
+            neighbourhood (float): points within this multiple of the radius of
+                                   the center are used to fit the model.
+            seed (int): seed for the points sampled to complete the model.
+    '''
+    iterations = Attribute('iterations', 100, converter=int)
+    radius = Attribute('radius', 0.2, converter=float)
+    min_radius = attr.ib(default=1e-4, converter=float)
+    max_radius = attr.ib(default=0.5, converter=float)
+    neighbourhood = attr.ib(default=2, converter=float)
+    seed = attr.ib(default=None)
+    rng = attr.ib(default=attr.Factory(lambda self: np.random.default_rng(self.seed), takes_self=True),
+                  init=False, repr=False)
+
+    def scale(self, X):
+        lower, upper = self.limits
+        return (np.atleast_2d(X) - lower) / (upper - lower)
+
+    def unscale(self, x):
+        lower, upper = self.limits
+        return lower + x * (upper - lower)
+
+    def nearby(self, center, radius):
+        ''' Returns the local coordinates, (x-center)/radius, and costs of the
+            observations within the neighbourhood of the center. '''
+        D = (self.scale(self.X) - center) / radius
+        n = D.shape[1]
+        near = np.flatnonzero(np.max(np.abs(D), axis=1) <= self.neighbourhood)[-(n+1)*(n+2):]
+        return D[near], -self.sign*self.y[near]
+
+    def features(self, D, terms):
+        ''' Returns the regression features of local coordinates D. '''
+        n = D.shape[1]
+        columns = [np.ones((len(D), 1)), D]
+        if terms != 'linear':
+            columns.append(D**2 / 2)
+        if terms == 'full':
+            i, j = np.triu_indices(n, 1)
+            columns.append(D[:, i] * D[:, j])
+        return np.hstack(columns)
+
+    def fit(self, D, costs):
+        ''' Fits the quadratic model and returns its value at the center,
+            gradient and Hessian in local coordinates. '''
+        n = D.shape[1]
+        if len(D) >= (n+1)*(n+2)//2:
+            terms = 'full'
+        elif len(D) >= 2*n+1:
+            terms = 'diagonal'
+        else:
+            terms = 'linear'
+        coefficients = np.linalg.lstsq(self.features(D, terms), costs, rcond=None)[0]
+        H = np.zeros((n, n))
+        if terms != 'linear':
+            H[np.diag_indices(n)] = coefficients[n+1:2*n+1]
+        if terms == 'full':
+            i, j = np.triu_indices(n, 1)
+            H[i, j] = H[j, i] = coefficients[2*n+1:]
+        return coefficients[0], coefficients[1:n+1], H
+
+    def geometry(self, D):
+        ''' Returns the direction in which the points within the trust region
+            are least spread, or None if they are spread well enough to trust
+            the model. '''
+        inside = D[np.max(np.abs(D), axis=1) <= 1]
+        n = D.shape[1]
+        if len(inside) < n+1:
+            return self.rng.uniform(-1, 1, n)
+        u, s, vt = np.linalg.svd(inside - inside.mean(axis=0))
+        if len(s) < n or s[-1] < 0.1*np.sqrt(len(inside)/n):
+            return vt[-1] * self.rng.choice([-1, 1])
+        return None
+
+    def minimize(self, g, H, lower, upper):
+        ''' Minimizes g.d + d.H.d/2 over the box lower <= d <= upper by
+            projected gradient descent from the steepest descent corner. '''
+        d = np.clip(-np.sign(g), lower, upper)
+        start = g @ d + d @ H @ d / 2
+        step = 1 / max(np.linalg.norm(H, 2), 1e-12)
+        for i in range(200):
+            d = np.clip(d - step * (g + H @ d), lower, upper)
+        value = g @ d + d @ H @ d / 2
+        if value > start:
+            d = np.clip(-np.sign(g), lower, upper)
+            value = start
+        return d, value
+
+    def _run(self):
+        bounds = np.array([self.bounds[name] for name in self.parameters], dtype=float)
+        self.limits = bounds[:, 0], bounds[:, 1]
+        n = len(bounds)
+        radius = self.radius()
+
+        if len(self.observations) > 0:
+            best = np.argmin(-self.sign*self.y)
+            center, cost = self.scale(self.X[best])[0], -self.sign*self.y[best]
+        else:
+            center = self.scale([p() for p in self.parameters.values()])[0]
+            cost = self.measure(self.unscale(center))
+
+        for i in self.range(self.iterations):
+            D, costs = self.nearby(center, radius)
+            lower = np.maximum(-1, -center / radius)
+            upper = np.minimum(1, (1 - center) / radius)
+            if len(D) < n+1:
+                fill = self.rng.uniform(-1, 1, (n+1-len(D), n))
+                self.measure_batch(self.unscale(np.clip(center + radius*fill, 0, 1)))
+                D, costs = self.nearby(center, radius)
+
+            f0, g, H = self.fit(D, costs - cost)
+            d, predicted = self.minimize(g, H, lower, upper)
+            new_cost = self.measure(self.unscale(center + radius*d))
+
+            ratio = (cost - new_cost) / max(-predicted, 1e-12)
+            if new_cost < cost:
+                center, cost = center + radius*d, new_cost
+            if ratio > 0.75 and np.max(np.abs(d)) > 0.99:
+                radius = min(2*radius, self.max_radius)
+            elif ratio < 0.25:
+                # before shrinking, make sure that the poor prediction is not due
+                # to points bunched along a few directions
+                direction = self.geometry(self.nearby(center, radius)[0])
+                if direction is None:
+                    radius /= 2
+                else:
+                    self.measure(self.unscale(np.clip(center + radius*direction, 0, 1)))
+            if radius < self.min_radius:
+                self.stop_reason = f'trust radius below {self.min_radius:.3g}'
+                break
@@ -0,0 +1,10 @@
+from optimistic.lazy import lazy
+
+__all__ = ['Objective', 'Rosenbrock', 'Rastrigin', 'GaussianPeaks', 'benchmark', 'suite', 'import_time']
+__getattr__, __dir__ = lazy(__name__, {'Objective': '.objectives',
+                                       'Rosenbrock': '.objectives',
+                                       'Rastrigin': '.objectives',
+                                       'GaussianPeaks': '.objectives',
+                                       'benchmark': '.runner',
+                                       'suite': '.runner',
+                                       'import_time': '.runner'})
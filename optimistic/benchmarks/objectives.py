@@ -0,0 +1,106 @@
+''' Synthetic objectives for benchmarking. Each objective owns one Parameter
+    per dimension (x0, x1, ...) so that it can be cloned by parallel executors,
+    and exposes the experiment in two forms: cost, which evaluates the current
+    point, and vectorized_cost, which broadcasts over arrays of points.
+
+    Objectives are written for minimization, so algorithms should be created
+    with sign=-1. Evaluation time and a timestamped history of results are
+    tracked on the instance; evaluations made on clones by parallel executors
+    are not counted.
+'''
+import time
+from abc import abstractmethod
+import numpy as np
+from parametric import Parameter
+from optimistic import experiment
+
+class Objective:
+    ''' Base class for benchmark objectives.
+
+        Arguments:
+            dim (int): number of parameters.
+            latency (float): simulated evaluation time in seconds, e.g. to mimic
+                             instrument readout.
+            noise (float): standard deviation of additive Gaussian noise.
+            seed (int): seed for the noise and any random problem structure.
+    '''
+    bounds = (-5, 5)
+    start = 1
+    optimum = 0
+
+    def __init__(self, dim=2, latency=0, noise=0, seed=None):
+        self.dim = dim
+        self.latency = latency
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.parameters = []
+        for i in range(dim):
+            parameter = Parameter(f'x{i}', self.start, bounds=self.bounds)
+            setattr(self, parameter.name, parameter)
+            self.parameters.append(parameter)
+        self.reset()
+
+    def reset(self):
+        ''' Returns to the starting point and clears the evaluation statistics. '''
+        for parameter in self.parameters:
+            parameter(self.start)
+        self.evaluations = 0
+        self.elapsed = 0
+        self.history = []
+
+    @abstractmethod
+    def function(self, X):
+        ''' Evaluates the objective at a 2d array of points. Reimplement for each objective. '''
+        return
+
+    def evaluate(self, X):
+        start = time.perf_counter()
+        if self.latency > 0:
+            time.sleep(self.latency)
+        values = self.function(X)
+        if self.noise > 0:
+            values = values + self.noise*self.rng.normal(size=len(values))
+        now = time.perf_counter()
+        self.elapsed += now - start
+        self.evaluations += len(values)
+        self.history.extend((now, value) for value in values)
+        return values
+
+    @experiment
+    def cost(self):
+        return self.evaluate(np.atleast_2d([p() for p in self.parameters]))[0]
+
+    @experiment(vectorized=True)
+    def vectorized_cost(self):
+        return self.evaluate(np.column_stack([np.atleast_1d(p()) for p in self.parameters]))
+
+class Rosenbrock(Objective):
+    bounds = (-2, 2)
+    start = -1.2
+
+    def function(self, X):
+        return np.sum(100*(X[:, 1:]-X[:, :-1]**2)**2 + (1-X[:, :-1])**2, axis=1)
+
+class Rastrigin(Objective):
+    bounds = (-5.12, 5.12)
+    start = 2.5
+
+    def function(self, X):
+        return 10*X.shape[1] + np.sum(X**2 - 10*np.cos(2*np.pi*X), axis=1)
+
+class GaussianPeaks(Objective):
+    ''' A sum of inverted Gaussian peaks at random locations. The deepest peak
+        has unit amplitude, so the optimum is close to -1. '''
+    bounds = (0, 1)
+    start = 0.5
+    optimum = -1
+
+    def __init__(self, dim=2, latency=0, noise=0, seed=None, peaks=3, width=0.1):
+        super().__init__(dim=dim, latency=latency, noise=noise, seed=seed)
+        self.centers = self.rng.uniform(0.1, 0.9, (peaks, dim))
+        self.amplitudes = np.append(1, self.rng.uniform(0.2, 0.8, peaks-1))
+        self.width = width
+
+    def function(self, X):
+        distances = np.sum((X[:, None, :] - self.centers[None])**2, axis=2)
+        return -np.sum(self.amplitudes*np.exp(-distances/(2*self.width**2)), axis=1)
@@ -0,0 +1,123 @@
+import sys
+import time
+import subprocess
+import tracemalloc
+import numpy as np
+import pandas as pd
+from optimistic.algorithms import GridSearch, GradientDescent
+from .objectives import Rosenbrock, Rastrigin, GaussianPeaks
+
+def benchmark(factory, objective, target=None, vectorized=False, memory=True):
+    ''' Runs an algorithm on a benchmark objective and returns a dict of metrics.
+
+        Arguments:
+            factory (callable): takes an experiment and returns an unconfigured
+                                Algorithm; the objective's parameters are added
+                                with the objective's bounds.
+            objective (Objective): the benchmark objective.
+            target (float): cost at which the objective counts as solved. Defaults
+                            to the known optimum plus 1% of the starting cost gap.
+            vectorized (bool): whether to run the vectorized form of the experiment.
+            memory (bool): whether to repeat the run under tracemalloc to record
+                           peak memory, which would otherwise distort the timing.
+
+        Returns:
+            evaluations, wall_time, evaluations_per_second, overhead_per_measure
+            (wall time not spent in the objective, per evaluation), best,
+            evaluations_to_target, time_to_target and peak_memory (bytes).
+    '''
+    def run():
+        objective.reset()
+        experiment = objective.vectorized_cost if vectorized else objective.cost
+        algorithm = factory(experiment)
+        for parameter in objective.parameters:
+            algorithm.add_parameter(parameter, bounds=objective.bounds)
+        start = time.perf_counter()
+        algorithm.run()
+        return algorithm, start, time.perf_counter() - start
+
+    algorithm, start, wall_time = run()
+    evaluations = len(algorithm.y)
+    results = {'evaluations': evaluations,
+               'wall_time': wall_time,
+               'evaluations_per_second': evaluations / wall_time,
+               'best': np.min(algorithm.y) if evaluations > 0 else np.nan}
+
+    if objective.evaluations > 0:
+        results['overhead_per_measure'] = (wall_time - objective.elapsed) / objective.evaluations
+    else:       # evaluated on clones by an executor
+        results['overhead_per_measure'] = np.nan
+
+    if target is None:
+        start_cost = objective.function(np.full((1, objective.dim), objective.start))[0]
+        target = objective.optimum + 0.01*(start_cost - objective.optimum)
+    times = np.array([t for t, value in objective.history])
+    values = np.array([value for t, value in objective.history])
+    reached = np.flatnonzero(values <= target)
+    results['evaluations_to_target'] = reached[0] + 1 if len(reached) > 0 else np.nan
+    results['time_to_target'] = times[reached[0]] - start if len(reached) > 0 else np.nan
+
+    results['peak_memory'] = np.nan
+    if memory:
+        tracemalloc.start()
+        run()
+        results['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return results
+
+def gaussian_process(experiment, steps=3, loops=10):
+    ''' Returns a Pipeline which seeds a GaussianProcess model with a coarse grid
+        and then measures the points it suggests. '''
+    from optimistic.pipeline import Pipeline, Loop
+    from optimistic.models import GaussianProcess
+    pipeline = Pipeline(experiment, sign=-1)
+    pipeline.add_block(GridSearch(steps=steps))
+    loop = Loop(loops=loops)
+    loop.add_block(GaussianProcess(restarts=0, acquisition='ei', seed=0))
+    pipeline.add_block(loop)
+    return pipeline
+
+def algorithms(dim):
+    ''' Default algorithm factories for suite(). '''
+    steps = max(2, int(round(400**(1/dim))))
+    return {'GridSearch': lambda experiment: GridSearch(experiment, sign=-1, steps=steps),
+            'GradientDescent': lambda experiment: GradientDescent(experiment, sign=-1, iterations=100,
+                                                                  learning_rate=1e-3, dither_size=1e-3),
+            'GaussianProcess': lambda experiment: gaussian_process(experiment, steps=max(2, int(round(9**(1/dim)))))}
+
+def suite(dim=2, latency=0, noise=0, factories=None, vectorized=False, memory=True):
+    ''' Benchmarks each algorithm on each standard objective and returns a
+        pandas.DataFrame of metrics, e.g.
+            from optimistic.benchmarks import suite
+            print(suite(dim=2))
+    '''
+    if factories is None:
+        factories = algorithms(dim)
+    objectives = {'Rosenbrock': Rosenbrock(dim, latency=latency, noise=noise),
+                  'Rastrigin': Rastrigin(dim, latency=latency, noise=noise),
+                  'GaussianPeaks': GaussianPeaks(dim, latency=latency, noise=noise, seed=0)}
+    rows = []
+    for objective_name, objective in objectives.items():
+        for algorithm_name, factory in factories.items():
+            row = {'objective': objective_name, 'algorithm': algorithm_name}
+            row.update(benchmark(factory, objective, vectorized=vectorized, memory=memory))
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+def import_time(statement='import optimistic', repeat=5):
+    ''' Returns the best wall time in seconds of running the import statement in
+        a fresh interpreter, together with the third-party modules it loaded, to
+        guard the startup cost of worker processes.
+    '''
+    code = f"""import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"""
+    best, modules = np.inf, []
+    for i in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split('\n')
+        best = min(best, float(output[0]))
+        modules = output[1].split()
+    return best, modules
@@ -1,7 +1,10 @@
+import asyncio
 import inspect
+import numpy as np
 from parametric import Parameter
 from functools import wraps, partial
 from copy import deepcopy
+from time import perf_counter
 
 def search_namespace(name):
     ''' Search two frames up for the referenced Parameter. For example, if
@@ -19,7 +22,16 @@ def search_namespace(name):
         raise Exception('Parameter not found in local namespace.')
 
 
-def experiment(func=None, *, ignored=[]):
+async def profiled(coroutine, profiler):
+    ''' Awaits the coroutine of an async experiment, recording the time until it
+        completes as the objective phase. '''
+    start = perf_counter()
+    try:
+        return await coroutine
+    finally:
+        profiler.add('objective', start)
+
+def experiment(func=None, *, ignored=[], vectorized=False):
     ''' Decorates an experiment function, which by default should have no positional
         or keyword arguments. Adds optional keyword arguments which are forwarded
         to update parameter values, which are searched by name recursively
@@ -33,14 +45,28 @@ def experiment(func=None, *, ignored=[]):
         containerizing the parameters. Passing parallel=True runs the decorated
         function in a new instance of the class, allowing simultaneous evaluation
         of different parameter sets.
+
+        Passing vectorized=True declares that the function is written with NumPy
+        operations that broadcast over arrays of parameter values. Algorithms can
+        then measure a whole batch of points in a single call by actuating each
+        parameter to an array of values (see Algorithm.measure_batch).
+
+        Coroutine functions (async def) can also be decorated. Parameters are
+        actuated when the decorated function is called, which then returns the
+        coroutine to be awaited. This lets Algorithm.arun() keep several
+        evaluations in flight, as long as the experiment reads the parameter
+        values it needs before its first await.
     '''
     if func is None:
-        return partial(experiment, ignored=ignored)
+        return partial(experiment, ignored=ignored, vectorized=vectorized)
 
     @wraps(func)
     def wrapper(*args, parallel=False, optimizer=None, **parameters):
         if not parallel:
             ## update parameters and call the decorated function
+            profiler = getattr(optimizer, 'profiler', None)
+            if profiler is not None:
+                start = perf_counter()
             for name, value in parameters.items():
                 if name in ignored:
                     continue
@@ -49,7 +75,15 @@ def experiment(func=None, *, ignored=[]):
                 else:
                     param = search_namespace(name)
                 param(value)
-            return func(*args)
+            if profiler is None:
+                return func(*args)
+            start = profiler.add('actuate', start)
+            if inspect.iscoroutinefunction(func):
+                return profiled(func(*args), profiler)
+            try:
+                return func(*args)
+            finally:
+                profiler.add('objective', start)
         else:
             ## clone the instance, then update parameters and call the cloned function
             if len(args) == 0:
@@ -61,4 +95,39 @@ def experiment(func=None, *, ignored=[]):
                 param = getattr(clone, name)
                 param(value)
             return func(clone)
+    wrapper.vectorized = vectorized
+    wrapper.ignored = ignored
     return wrapper
+
+def evaluate_batch(experiment, names, points):
+    ''' Evaluates an experiment method at each of a 2d array of points on a single
+        clone of the instance owning it. This is the unit of work submitted to
+        parallel executors, so that the instance is copied once per batch rather
+        than once per point as with parallel=True.
+    '''
+    if not hasattr(experiment, '__self__'):
+        raise IndexError('Parallel optimization is supported for class methods only to ensure Parameter containerization.')
+    clone = deepcopy(experiment.__self__)
+    func = experiment.__wrapped__
+    ignored = getattr(experiment, 'ignored', [])
+
+    def actuate(values):
+        for name, value in zip(names, values):
+            if name not in ignored:
+                getattr(clone, name)(value)
+
+    def call():
+        result = func(clone)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+        return result
+
+    if getattr(experiment, 'vectorized', False):
+        actuate(points.T)
+        return list(np.broadcast_to(call(), len(points)))
+
+    results = []
+    for point in points:
+        actuate(point)
+        results.append(call())
+    return results
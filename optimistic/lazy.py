@@ -0,0 +1,27 @@
+''' Lazy imports of the public names of a package (PEP 562), so that importing
+    a package does not import every submodule and its dependencies. '''
+import sys
+import importlib
+
+def lazy(package, exports):
+    ''' Returns __getattr__ and __dir__ functions for a package, which import
+        each exported name from its submodule on first access.
+
+        Arguments:
+            package (str): the __name__ of the package.
+            exports (dict): submodules relative to the package, indexed by the
+                            names they export.
+    '''
+    module = sys.modules[package]
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
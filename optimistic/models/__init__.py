@@ -1,4 +1,8 @@
-from .model import Model
-from .surface import Surface
-from .gaussian import Gaussian
-from .gaussian_process import GaussianProcess
+from optimistic.lazy import lazy
+
+__all__ = ['Model', 'Surface', 'Gaussian', 'GaussianProcess', 'SparseGaussianProcess']
+__getattr__, __dir__ = lazy(__name__, {'Model': '.model',
+                                       'Surface': '.surface',
+                                       'Gaussian': '.gaussian',
+                                       'GaussianProcess': '.gaussian_process',
+                                       'SparseGaussianProcess': '.sparse_gaussian_process'})
@@ -0,0 +1,32 @@
+''' Acquisition functions score candidate points from a model's predicted mean
+    and uncertainty. Following the convention of Model.optimize, each function
+    returns a score to be minimized, given the predicted cost mean and standard
+    deviation and the best (lowest) cost observed so far.
+'''
+import numpy as np
+from scipy.stats import norm
+
+def mean(mean, std, best):
+    ''' Pure exploitation: the predicted cost. '''
+    return mean
+
+def lower_confidence_bound(mean, std, best, kappa=2):
+    ''' The optimistic estimate of the cost, which is the upper confidence bound
+        of the objective for maximization problems. '''
+    return mean - kappa*std
+
+def expected_improvement(mean, std, best, xi=0.01):
+    std = np.maximum(std, 1e-12)
+    improvement = best - mean - xi
+    z = improvement / std
+    return -(improvement*norm.cdf(z) + std*norm.pdf(z))
+
+def probability_of_improvement(mean, std, best, xi=0.01):
+    std = np.maximum(std, 1e-12)
+    return -norm.cdf((best - mean - xi) / std)
+
+acquisitions = {'mean': mean,
+                'ucb': lower_confidence_bound,
+                'lcb': lower_confidence_bound,
+                'ei': expected_improvement,
+                'pi': probability_of_improvement}
@@ -21,10 +21,9 @@ class Gaussian(Model):
         return result
 
     def fit(self, data):
-        self.data = data
         N = len(self.parameters)
         p0 = tuple([0.5]*(2*N+1))
-        points = data[self.parameters].values
+        points = data[list(self.parameters)].values
         costs = data[self.experiment.__name__].values
         self.popt, self.pcov = curve_fit(self.gaussian, points, costs, p0)
 
@@ -1,23 +1,113 @@
 import attr
 import numpy as np
+from scipy.linalg import cholesky, cho_solve, solve_triangular
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF, ConstantKernel as C, WhiteKernel
 from optimistic.models import Model
 
 @attr.s
 class GaussianProcess(Model):
+    ''' Gaussian process regression of the cost surface.
+
+        Arguments:
+            restarts (int): number of restarts of the hyperparameter optimizer.
+            incremental (bool): if True, observations appended since the previous
+                                fit are added by extending the Cholesky factor of
+                                the kernel matrix, which costs O(n^2) per point.
+                                Hyperparameters are only reoptimized, starting
+                                from the previous kernel, after refit_every new
+                                points or when the new points are poorly predicted.
+                                If the costs of earlier points changed, e.g. by
+                                renormalization, the weights are resolved in O(n^2).
+            refit_every (int): number of new points between hyperparameter fits
+                               in incremental mode.
+            drift_threshold (float): mean squared standardized residual of the new
+                                     points above which hyperparameters are refit early.
+    '''
     amplitude = attr.ib(default=1, converter=float)
     length_scale = attr.ib(default=1, converter=float)
     noise = attr.ib(default=0.1, converter=float)
     kernel = attr.ib(default=None)
+    restarts = attr.ib(default=10, converter=int)
+    incremental = attr.ib(default=False, converter=bool)
+    refit_every = attr.ib(default=10, converter=int)
+    drift_threshold = attr.ib(default=4, converter=float)
+    jitter = attr.ib(default=1e-10, converter=float)
+
+    X_train = attr.ib(default=None, init=False, repr=False)
+    y_train = attr.ib(default=None, init=False, repr=False)
+    residuals = attr.ib(factory=list, init=False, repr=False)
 
     def fit(self, data):
         if self.kernel is None:
             self.kernel = C(self.amplitude, (1e-3, 1e3)) * RBF(self.length_scale, (1e-2, 1e2)) + WhiteKernel(self.noise)
-        self.model = GaussianProcessRegressor(kernel=self.kernel, n_restarts_optimizer=10)
-        points = data[self.parameters].values
-        costs = data[self.experiment.__name__]
+        points = data[list(self.parameters)].values
+        costs = data[self.experiment.__name__].values
+        if not self.incremental:
+            self.model = GaussianProcessRegressor(kernel=self.kernel, n_restarts_optimizer=self.restarts)
+            self.model.fit(points, costs)
+            return
+
+        n = 0 if self.X_train is None else len(self.X_train)
+        if n == 0 or len(points) < n or not np.array_equal(points[:n], self.X_train):
+            self.refit(points, costs)
+            return
+        if not np.array_equal(costs[:n], self.y_train):
+            # earlier costs change when the data is renormalized
+            self.y_train = np.array(costs[:n], dtype=float)
+            self.alpha = cho_solve((self.L, True), self.y_train)
+        if len(points) == n:
+            return
+
+        residuals = []
+        for x, y in zip(points[n:], costs[n:]):
+            mean, std = self.predict(x)
+            residuals.append(((y - mean[0]) / std[0])**2)
+            self.extend(x, y)
+        self.residuals = self.residuals + residuals
+
+        if len(self.residuals) >= self.refit_every or np.mean(self.residuals) > self.drift_threshold:
+            self.refit(points, costs)
+
+    def refit(self, points, costs):
+        ''' Optimizes the hyperparameters, warm-started from the previous kernel,
+            and refactorizes the kernel matrix. '''
+        warm = self.X_train is not None
+        self.model = GaussianProcessRegressor(kernel=self.kernel, n_restarts_optimizer=0 if warm else self.restarts)
         self.model.fit(points, costs)
+        self.kernel = self.model.kernel_
+        self.factorize(points, costs)
+
+    def factorize(self, points, costs):
+        self.X_train = np.array(points, dtype=float)
+        self.y_train = np.array(costs, dtype=float)
+        K = self.kernel(self.X_train) + self.jitter*np.eye(len(self.X_train))
+        self.L = cholesky(K, lower=True)
+        self.alpha = cho_solve((self.L, True), self.y_train)
+        self.residuals = []
+
+    def extend(self, x, y):
+        ''' Adds one observation by a rank-one extension of the Cholesky factor. '''
+        x = np.atleast_2d(x)
+        k = self.kernel(self.X_train, x)[:, 0]
+        kss = self.kernel.diag(x)[0] + self.jitter
+        l = solve_triangular(self.L, k, lower=True)
+        n = len(self.L)
+        L = np.zeros((n+1, n+1))
+        L[:n, :n] = self.L
+        L[n, :n] = l
+        L[n, n] = np.sqrt(max(kss - l @ l, self.jitter))
+        self.L = L
+        self.X_train = np.append(self.X_train, x, axis=0)
+        self.y_train = np.append(self.y_train, y)
+        self.alpha = cho_solve((self.L, True), self.y_train)
 
     def predict(self, X):
-        return self.model.predict(np.atleast_2d(X), return_std = True)
+        X = np.atleast_2d(X)
+        if not self.incremental:
+            return self.model.predict(X, return_std = True)
+        Ks = self.kernel(X, self.X_train)
+        mean = Ks @ self.alpha
+        v = solve_triangular(self.L, Ks.T, lower=True)
+        var = self.kernel.diag(X) - np.sum(v**2, axis=0)
+        return mean, np.sqrt(np.clip(var, 0, None))
@@ -1,7 +1,11 @@
 import attr
+from copy import deepcopy
 from abc import abstractmethod
+import scipy.optimize
 from optimistic.pipeline import Pipeline
 import numpy as np
+import pandas as pd
+from .acquisition import acquisitions
 
 @attr.s
 class Model(Pipeline):
@@ -9,7 +13,29 @@ class Model(Pipeline):
         which can consume data from the primary pipeline to fit a surface to observed data,
         numerically optimize the surface to inform future sampling choices, then make a physical
         measurement at the optimized point.
+
+        Arguments:
+            starts (int): number of random starting points for the L-BFGS-B
+                          search used by optimize() when no blocks are added.
+            seed (int): seed for random number generation, e.g. of starting points.
+            acquisition (str or callable): function of the predicted mean, standard
+                                           deviation and best observed cost which
+                                           is minimized to choose the next point.
+                                           One of 'mean', 'ucb', 'ei' or 'pi', or a
+                                           callable from optimistic.models.acquisition.
+            q (int): number of points suggested per fit. Points after the first
+                     are chosen with the kriging believer heuristic: the model is
+                     refit with the previous suggestions and their predicted costs.
+                     This is cheap for models which fit incrementally, such as
+                     GaussianProcess(incremental=True).
         '''
+    starts = attr.ib(default=10, converter=int)
+    seed = attr.ib(default=None)
+    acquisition = attr.ib(default='mean')
+    q = attr.ib(default=1, converter=int)
+    best = attr.ib(default=None, init=False)
+    rng = attr.ib(default=attr.Factory(lambda self: np.random.default_rng(self.seed), takes_self=True),
+                  init=False, repr=False)
 
     @abstractmethod
     def predict(self, point):
@@ -23,18 +49,80 @@ class Model(Pipeline):
         return
 
     def measure(self, X):
-        row = dict(zip(self.parameters, np.array(X).flatten()))
-        row[self.experiment.__name__] = self.predict(X)[0][0]
+        return self.measure_batch(X)[0]
+
+    def acquire(self, points):
+        ''' Returns the acquisition score of a 2d array of points. '''
+        points = np.atleast_2d(points)
+        mean, std = self.predict(points)
+        mean = np.broadcast_to(mean, len(points)).astype(float)
+        std = np.broadcast_to(std, len(points)).astype(float)
+        best = self.best if self.best is not None else mean.min()
+        acquisition = acquisitions.get(self.acquisition, self.acquisition)
+        return acquisition(mean, std, best)
+
+    def measure_batch(self, points):
+        ''' Evaluates the acquisition function at a 2d array of points with a
+            single call to predict() and records the scores. '''
+        points = np.atleast_2d(points)
+        costs = self.acquire(points)
+        self.observations.extend(points, costs)
+        return costs
+
+    def suggest(self, data, q=1):
+        ''' Fits the model to the data and returns a 2d array of q points to measure next. '''
+        name = self.experiment.__name__
+        self.fit(data)
+        self.best = data[name].min()
+        points = [self.optimize()]
+        if q == 1:
+            return np.atleast_2d(points)
 
-        self.data = self.data.append(row, ignore_index=True)
-        return row[self.experiment.__name__]
+        model = self.fantasy()
+        fantasy = data
+        for i in range(1, q):
+            row = dict(zip(self.parameters, points[-1]))
+            row[name] = model.predict(points[-1])[0][0]
+            fantasy = pd.concat([fantasy, pd.DataFrame([row])], ignore_index=True)
+            model.fit(fantasy)
+            points.append(model.optimize())
+        return np.array(points)
+
+    def fantasy(self):
+        ''' Returns a copy of the model to fit with fantasy points, so that fitting
+            and optimizing it leaves this model unchanged. The fitted state and
+            observations are copied, while the experiment, parameters and other
+            references to the outside are shared. '''
+        shared = ['experiment', 'parameters', 'parent', 'callbacks', 'cache', 'log',
+                  'executor', 'handle', 'profiler', 'output']
+        memo = {id(getattr(self, name)): getattr(self, name) for name in shared if hasattr(self, name)}
+        return deepcopy(self, memo)
 
     def optimize(self):
         ''' Optimizes on the response surface using the added blocks and returns
-            the best point. '''
+            the best point. If no blocks were added, runs a multi-start L-BFGS-B
+            search instead. '''
+        if len(self.blocks) == 0:
+            return self.minimize()
+        self.observations.clear()
         for block in self.blocks:
             self.clone(block)
             block.measure = self.measure
+            block.measure_batch = self.measure_batch
             block.run()
-            self.data = self.data.append(block.data)
-        return self.data.iloc[self.data[self.experiment.__name__].idxmin()][self.parameters].values
+        return self.observations.X[np.argmin(self.observations.y)].copy()
+
+    def minimize(self):
+        ''' Minimizes the acquisition function with L-BFGS-B from self.starts random
+            points within the bounds, plus the best point found so far. '''
+        bounds = np.array([self.bounds[name] for name in self.parameters], dtype=float)
+        starts = self.rng.uniform(bounds[:, 0], bounds[:, 1], (self.starts, len(bounds)))
+        if len(self.observations) > 0:
+            starts = np.append(starts, [self.observations.X[np.argmin(self.observations.y)]], axis=0)
+
+        best, best_cost = None, np.inf
+        for x0 in starts:
+            result = scipy.optimize.minimize(lambda x: self.acquire(x)[0], x0, method='L-BFGS-B', bounds=bounds)
+            if result.fun < best_cost:
+                best, best_cost = result.x, result.fun
+        return best
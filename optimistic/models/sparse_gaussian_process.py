@@ -0,0 +1,73 @@
+import attr
+import numpy as np
+from scipy.linalg import cholesky, solve_triangular
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import RBF, ConstantKernel as C, WhiteKernel
+from optimistic.models import Model
+
+@attr.s
+class SparseGaussianProcess(Model):
+    ''' A sparse Gaussian process regression of the cost surface, using the
+        inducing point approximation of Titsias (2009). Fitting costs O(n m^2)
+        time and O(m^2) memory for n observations and m inducing points,
+        compared to O(n^3) time and O(n^2) memory for GaussianProcess.
+
+        Hyperparameters are fit by an exact Gaussian process on a random subset
+        of the data. The kernel must be the sum of a signal kernel and a
+        WhiteKernel describing the measurement noise.
+
+        Arguments:
+            inducing_points (int): number of inducing points, chosen at random
+                                   from the observations.
+            subset (int): number of observations used to fit the hyperparameters.
+            chunksize (int): number of observations processed at once when
+                             accumulating the fit, bounding memory to O(chunksize*m).
+    '''
+    amplitude = attr.ib(default=1, converter=float)
+    length_scale = attr.ib(default=1, converter=float)
+    noise = attr.ib(default=0.1, converter=float)
+    kernel = attr.ib(default=None)
+    restarts = attr.ib(default=2, converter=int)
+    inducing_points = attr.ib(default=200, converter=int)
+    subset = attr.ib(default=1000, converter=int)
+    chunksize = attr.ib(default=10000, converter=int)
+    jitter = attr.ib(default=1e-8, converter=float)
+
+    def fit(self, data):
+        if self.kernel is None:
+            self.kernel = C(self.amplitude, (1e-3, 1e3)) * RBF(self.length_scale, (1e-2, 1e2)) + WhiteKernel(self.noise)
+        points = data[list(self.parameters)].values.astype(float)
+        costs = data[self.experiment.__name__].values.astype(float)
+
+        self.y_mean = costs.mean()
+        costs = costs - self.y_mean
+
+        subset = self.rng.choice(len(points), min(self.subset, len(points)), replace=False)
+        model = GaussianProcessRegressor(kernel=self.kernel, n_restarts_optimizer=self.restarts)
+        model.fit(points[subset], costs[subset])
+        self.signal = model.kernel_.k1
+        self.noise_variance = model.kernel_.k2.noise_level
+
+        inducing = self.rng.choice(len(points), min(self.inducing_points, len(points)), replace=False)
+        self.Z = points[inducing]
+        m = len(self.Z)
+        self.Luu = cholesky(self.signal(self.Z) + self.jitter*np.eye(m), lower=True)
+
+        sigma = np.sqrt(self.noise_variance)
+        B = np.eye(m)
+        Ay = np.zeros(m)
+        for start in range(0, len(points), self.chunksize):
+            X = points[start:start+self.chunksize]
+            A = solve_triangular(self.Luu, self.signal(self.Z, X), lower=True) / sigma
+            B += A @ A.T
+            Ay += A @ costs[start:start+self.chunksize] / sigma
+        self.LB = cholesky(B, lower=True)
+        self.c = solve_triangular(self.LB, Ay, lower=True)
+
+    def predict(self, X):
+        X = np.atleast_2d(X)
+        tmp1 = solve_triangular(self.Luu, self.signal(self.Z, X), lower=True)
+        tmp2 = solve_triangular(self.LB, tmp1, lower=True)
+        mean = tmp2.T @ self.c + self.y_mean
+        var = self.signal.diag(X) - np.sum(tmp1**2, axis=0) + np.sum(tmp2**2, axis=0) + self.noise_variance
+        return mean, np.sqrt(np.clip(var, 0, None))
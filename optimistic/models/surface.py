@@ -11,13 +11,12 @@ class Surface(Model):
     p0 = attr.ib(default=None)
 
     def fit(self, data):
-        self.data = data
         if self.surface is None:
             raise ValueError('Specify a surface!')
         dof = len(inspect.signature(self.surface).parameters)-1
         if self.p0 is None:
             self.p0 = tuple([0.5]*dof)
-        points = data[self.parameters].values
+        points = data[list(self.parameters)].values
         costs = data[self.experiment.__name__].values
         self.popt, self.pcov = curve_fit(self.objective_function, points, costs, self.p0)
 
@@ -13,5 +13,6 @@ class Loop(Pipeline):
     loops = attr.ib(default=1, converter=int)
 
     def run(self):
-        for i in range(self.loops):
+        self.begin()
+        for i in self.range(self.loops):
             Pipeline.run(self)
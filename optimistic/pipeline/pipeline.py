@@ -7,30 +7,72 @@ from optimistic.algorithms import Algorithm
 
 @attr.s
 class Pipeline(Algorithm):
+    ''' A sequence of blocks sharing the Pipeline's observations. Measurements
+        made by each block are appended to the Pipeline in one chunk when the
+        block finishes, while nested pipelines such as Loop record directly into
+        the shared observations. Model blocks are fit to all data gathered so
+        far, and blocks such as Prune filter the observations in place.
+
+        The data and data_normalized DataFrames are built from the observations
+        on first access and cached until the observations change.
+    '''
     blocks = attr.ib(factory=list)
+    _frames = attr.ib(factory=dict, init=False, repr=False, eq=False)
 
     def add_block(self, block):
         self.blocks.append(block)
 
     def clone(self, block):
         ''' Copies over settings from the Pipeline to the block. '''
+        from optimistic.models import Model
         block.experiment = self.experiment
         block.parameters = self.parameters
         block.bounds = self.bounds
         block.points = self.points
         block.delays = self.delays
-        block.dependent_variables = self.dependent_variables
         block.parent = self
+        if isinstance(block, Pipeline) and not isinstance(block, Model):
+            block.observations = self.observations
         
+    def frame(self, key, build):
+        ''' Returns a DataFrame derived from the observations, rebuilding it
+            only if the observations changed since it was cached. '''
+        version, df = self._frames.get(key, (None, None))
+        if version != self.observations.version:
+            df = build()
+            self._frames[key] = (self.observations.version, df)
+        return df
+
+    @property
+    def data(self):
+        return self.frame('data', lambda: self.dataset)
+
+    @property
+    def data_normalized(self):
+        ''' The data with the experiment column replaced by the cost, standardized
+            to zero mean and unit variance, which Model blocks minimize. '''
+        def normalize():
+            df = self.data.copy()
+            costs = -self.sign*self.y
+            std = costs.std()
+            df[self.experiment.__name__] = (costs - costs.mean()) / (std if std > 0 else 1)
+            return df
+        return self.frame('data_normalized', normalize)
+
     def run(self):
         from optimistic.models import Model
 
         for block in self.blocks:
             self.clone(block)
             if isinstance(block, Model):
-                block.fit(self.data_normalized)
-                suggested_point = block.optimize()
-                self.measure(suggested_point)
+                suggested_points = block.suggest(self.data_normalized, q=block.q)
+                self.measure_batch(suggested_points)
             else:
+                start = len(block.observations)
                 block.run()
-                self.data = self.data.append(block.data)
+                if block.observations is self.observations:
+                    self.evaluations += block.evaluations
+                    self.best_cost = min(self.best_cost, block.best_cost)
+                elif len(block.observations) > start:
+                    self.record(block.X[start:], block.y[start:])
+            self.notify('on_block_end', block)
@@ -3,7 +3,7 @@ from optimistic.algorithms import Algorithm
 
 @attr.s
 class Prune(Algorithm):
-    ''' The Prune block removes points in the Pipeline.data set which are
+    ''' The Prune block removes points in the Pipeline's observations which are
         above a threshold cost (as a fraction of the best found cost). This
         can be used to discard low-impact points (far from known minima)
         to improve model training efficiency.
@@ -11,6 +11,6 @@ class Prune(Algorithm):
     threshold = attr.ib(default=0.5, converter=float)
 
     def run(self):
-        costs = self.parent.data[self.experiment.__name__]
+        costs = self.parent.y
         threshold = self.threshold * costs.min()
-        self.parent.data = self.parent.data[costs < threshold].reset_index()
+        self.parent.observations.keep(costs < threshold)
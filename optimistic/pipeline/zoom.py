@@ -10,8 +10,8 @@ class Zoom(Algorithm):
     threshold = attr.ib(default=0.5, converter=float)
 
     def run(self):
-        costs = self.parent.data[self.experiment.__name__]
+        costs = self.parent.y
         threshold = costs.min() * self.threshold
-        for p in self.parameters:
-            valid_points = self.parent.data[costs < threshold][p]
-            self.parent.bounds[p] = (valid_points.min(), valid_points.max())
+        valid_points = self.parent.X[costs < threshold]
+        for i, p in enumerate(self.parameters):
+            self.parent.bounds[p] = (valid_points[:, i].min(), valid_points[:, i].max())
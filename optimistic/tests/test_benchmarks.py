@@ -0,0 +1,24 @@
+from optimistic.algorithms import GridSearch
+from optimistic.benchmarks import Rosenbrock, benchmark, suite
+import numpy as np
+
+def test_objective_forms_agree():
+    objective = Rosenbrock(3)
+    X = np.array([[1, 1, 1], [0, 0, 0]])
+    assert (objective.function(X) == [0, 2]).all()
+    objective.x0(np.array([1, 0]))
+    objective.x1(np.array([1, 0]))
+    objective.x2(np.array([1, 0]))
+    assert (objective.vectorized_cost() == [0, 2]).all()
+
+def test_benchmark_metrics():
+    results = benchmark(lambda e: GridSearch(e, sign=-1, steps=5), Rosenbrock(2), target=1)
+    assert results['evaluations'] == 25
+    assert results['best'] == 0
+    assert results['evaluations_to_target'] <= 25
+    assert results['peak_memory'] > 0
+
+def test_suite():
+    df = suite(dim=2, memory=False, vectorized=True)
+    assert len(df) == 9
+    assert (df['evaluations'] > 0).all()
@@ -0,0 +1,32 @@
+from parametric import Parameter
+from optimistic.algorithms import GridSearch
+from optimistic.algorithms.cache import EvaluationCache
+from optimistic import experiment
+
+def test_cache_quantization_and_eviction():
+    cache = EvaluationCache(resolution={'x': 0.1}, maxsize=2)
+    cache.put([0.51, 2], ['x', 'y'], 1)
+    assert cache.get([0.49, 2], ['x', 'y']) == 1
+    assert cache.get([0.5, 2.01], ['x', 'y']) is None
+    cache.put([1, 2], ['x', 'y'], 2)
+    cache.put([2, 2], ['x', 'y'], 3)
+    assert len(cache) == 2
+    assert cache.get([0.5, 2], ['x', 'y']) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_repeated_grid_search_uses_cache():
+    x = Parameter('x')
+    calls = []
+
+    @experiment
+    def result():
+        calls.append(x())
+        return x**2
+
+    opt = GridSearch(result, steps=5, cache=EvaluationCache())
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.run()
+    opt.run()
+    assert len(calls) == 5
+    assert len(opt.y) == 10
+    assert opt.cache.hits == 5
@@ -0,0 +1,38 @@
+from parametric import Parameter
+from optimistic.algorithms import GridSearch
+from optimistic.algorithms.executors import ThreadExecutor, ProcessExecutor
+from optimistic import experiment
+import pytest
+
+class Simulation:
+    def __init__(self):
+        self.x = Parameter('x', 0)
+
+    @experiment
+    def result(self):
+        return self.x()**2
+
+@pytest.mark.parametrize('executor', [ThreadExecutor(workers=2), ProcessExecutor(workers=2), 'serial'])
+def test_executor_grid_search(executor):
+    sim = Simulation()
+    opt = GridSearch(sim.result, steps=5, executor=executor)
+    opt.add_parameter(sim.x, bounds=(-1, 1))
+    opt.run()
+    opt.executor.shutdown()
+    assert (opt.X.flatten() == [-1, -0.5, 0, 0.5, 1]).all()
+    assert (opt.y == [1, 0.25, 0, 0.25, 1]).all()
+    assert sim.x() == 0
+
+@pytest.mark.parametrize('executor', [ThreadExecutor(workers=2), 'serial'])
+def test_executor_plain_function(executor):
+    x = Parameter('x', 0)
+
+    @experiment
+    def result():
+        return x**2
+
+    opt = GridSearch(result, steps=5, executor=executor)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.run()
+    opt.executor.shutdown()
+    assert (opt.y == [1, 0.25, 0, 0.25, 1]).all()
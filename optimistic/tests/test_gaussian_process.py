@@ -0,0 +1,111 @@
+from parametric import Parameter
+from optimistic.models import GaussianProcess, SparseGaussianProcess
+from optimistic import experiment
+from sklearn.gaussian_process import GaussianProcessRegressor
+import numpy as np
+import pandas as pd
+import warnings
+
+@experiment
+def cost():
+    return 0
+
+def test_incremental_fit_matches_exact():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1, 1, (40, 2))
+    data = pd.DataFrame(points, columns=['x', 'y'])
+    data['cost'] = np.sin(3*points[:, 0]) * np.cos(2*points[:, 1])
+
+    parameters = {'x': Parameter('x'), 'y': Parameter('y')}
+    gp = GaussianProcess(cost, parameters=parameters, incremental=True, refit_every=100, restarts=0)
+    gp.fit(data.iloc[:20])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        gp.fit(data.iloc[:20])
+    for n in range(21, 41):
+        gp.fit(data.iloc[:n])
+    assert len(gp.X_train) == 40
+
+    exact = GaussianProcessRegressor(kernel=gp.kernel, optimizer=None).fit(points, data['cost'])
+    mean, std = gp.predict(points[:5])
+    exact_mean, exact_std = exact.predict(points[:5], return_std=True)
+    assert np.allclose(mean, exact_mean)
+    assert np.allclose(std, exact_std)
+
+def test_sparse_fit_approximates_surface():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1, 1, (2000, 2))
+    data = pd.DataFrame(points, columns=['x', 'y'])
+    data['cost'] = np.sin(3*points[:, 0]) * np.cos(2*points[:, 1])
+
+    parameters = {'x': Parameter('x'), 'y': Parameter('y')}
+    gp = SparseGaussianProcess(cost, parameters=parameters, inducing_points=100, subset=200, chunksize=500, seed=0)
+    gp.fit(data)
+    test = rng.uniform(-1, 1, (10, 2))
+    mean, std = gp.predict(test)
+    assert np.allclose(mean, np.sin(3*test[:, 0]) * np.cos(2*test[:, 1]), atol=0.05)
+    assert std.shape == (10,)
+
+def test_optimize_surrogate():
+    from optimistic.algorithms import GridSearch
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1, 1, (60, 2))
+    data = pd.DataFrame(points, columns=['x', 'y'])
+    data['cost'] = (points[:, 0]-0.3)**2 + (points[:, 1]+0.2)**2
+
+    gp = GaussianProcess(cost, restarts=0, seed=0)
+    gp.add_parameter(Parameter('x'), bounds=(-1, 1))
+    gp.add_parameter(Parameter('y'), bounds=(-1, 1))
+    gp.fit(data)
+    assert np.allclose(gp.optimize(), [0.3, -0.2], atol=0.05)
+
+    gp.add_block(GridSearch(steps=21))
+    assert np.allclose(gp.optimize(), [0.3, -0.2], atol=0.11)
+    assert len(gp.observations) == 21**2
+
+def test_batch_suggestions():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-1, 1, (10, 2))
+    data = pd.DataFrame(points, columns=['x', 'y'])
+    data['cost'] = np.sin(3*points[:, 0]) * np.cos(2*points[:, 1])
+
+    gp = GaussianProcess(cost, restarts=0, seed=0, incremental=True, acquisition='ucb', starts=3)
+    gp.add_parameter(Parameter('x'), bounds=(-1, 1))
+    gp.add_parameter(Parameter('y'), bounds=(-1, 1))
+    gp.suggest(data)
+    L = gp.L.copy()
+    suggestions = gp.suggest(data, q=3)
+    assert suggestions.shape == (3, 2)
+    assert (gp.L == L).all()
+    assert len(np.unique(suggestions.round(3), axis=0)) == 3
+    assert len(gp.X_train) == 10
+
+    from optimistic.algorithms import GridSearch
+    gp.add_block(GridSearch(steps=11))
+    suggestions = gp.suggest(data, q=2)
+    assert (gp.observations.X[np.argmin(gp.observations.y)] == suggestions[0]).all()
+
+def test_incremental_fit_in_loop():
+    from optimistic.algorithms import GridSearch
+    from optimistic.pipeline import Pipeline, Loop
+    x, y = Parameter('x', 0), Parameter('y', 0)
+
+    @experiment
+    def cost():
+        return np.sin(3*x()) * np.cos(2*y())
+
+    pipeline = Pipeline(cost, sign=-1)
+    pipeline.add_parameter(x, bounds=(-1, 1))
+    pipeline.add_parameter(y, bounds=(-1, 1))
+    pipeline.add_block(GridSearch(steps=3))
+    loop = Loop(loops=8)
+    gp = GaussianProcess(incremental=True, refit_every=100, drift_threshold=np.inf, restarts=0, seed=0, starts=3)
+    loop.add_block(gp)
+    pipeline.add_block(loop)
+    pipeline.run()
+
+    data = pipeline.data_normalized
+    gp.fit(data)
+    exact = GaussianProcessRegressor(kernel=gp.kernel, optimizer=None).fit(pipeline.X, data['cost'])
+    assert np.allclose(gp.y_train, data['cost'])
+    assert np.allclose(gp.predict(pipeline.X)[0], exact.predict(pipeline.X))
@@ -0,0 +1,24 @@
+from parametric import Parameter
+from optimistic.algorithms import GradientDescent
+from optimistic import experiment
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize('estimator,update,learning_rate', [('central', 'sgd', 0.1),
+                                                            ('spsa', 'momentum', 0.02),
+                                                            ('spsa', 'adam', 0.05)])
+def test_gradient_descent(estimator, update, learning_rate):
+    parameters = [Parameter(f'x{i}', 0.5) for i in range(5)]
+
+    @experiment
+    def result():
+        return sum((p() - 0.1*i)**2 for i, p in enumerate(parameters))
+
+    opt = GradientDescent(result, sign=-1, iterations=200, learning_rate=learning_rate,
+                          dither_size=1e-3, estimator=estimator, update=update, seed=0)
+    for p in parameters:
+        opt.add_parameter(p, bounds=(-1, 1))
+    opt.run()
+    assert np.allclose(opt.X[-1], 0.1*np.arange(5), atol=0.02)
+    evaluations_per_step = 11 if estimator == 'central' else 3
+    assert len(opt.y) == 200*evaluations_per_step
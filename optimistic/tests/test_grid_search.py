@@ -2,6 +2,7 @@ from parametric import Parameter
 from optimistic.algorithms import GridSearch
 from optimistic import experiment
 import numpy as np
+import pytest
 
 def test_grid_search():
     x = Parameter('x')
@@ -14,3 +15,119 @@ def test_grid_search():
     opt.add_parameter(x, bounds=(-1, 1))
     opt.run()
     assert (opt.X.flatten() == [-1, -0.5, 0, 0.5, 1]).all()
+
+def test_vectorized_grid_search():
+    x = Parameter('x')
+    calls = []
+
+    @experiment(vectorized=True)
+    def result():
+        calls.append(1)
+        return x**2
+
+    opt = GridSearch(result, steps=5)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.run()
+    assert len(calls) == 1
+    assert (opt.X.flatten() == [-1, -0.5, 0, 0.5, 1]).all()
+    assert (opt.y == [1, 0.25, 0, 0.25, 1]).all()
+    assert x() == 1
+
+def test_async_grid_search():
+    import asyncio
+    x = Parameter('x')
+
+    @experiment
+    async def result():
+        value = x**2
+        await asyncio.sleep(0.05)
+        return value
+
+    opt = GridSearch(result, steps=5, concurrency=5)
+    opt.add_parameter(x, bounds=(-1, 1))
+    asyncio.run(opt.arun())
+    assert (opt.y == [1, 0.25, 0, 0.25, 1]).all()
+
+def test_snake_order():
+    x = Parameter('x')
+    y = Parameter('y')
+
+    @experiment
+    def result():
+        return x**2 + y**2
+
+    opt = GridSearch(result, steps=4, order='snake', delays={'x': 1, 'y': 10}, lazy_actuation=True)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.add_parameter(y, bounds=(-1, 1))
+    opt.run()
+    changes = (opt.X[1:] != opt.X[:-1])
+    assert (changes.sum(axis=1) == 1).all()
+    assert changes[:, 1].sum() == 3
+
+def test_lazy_actuation_after_vectorized_batch():
+    x = Parameter('x')
+
+    @experiment(vectorized=True)
+    def result():
+        return x**2
+
+    opt = GridSearch(result, sign=-1, lazy_actuation=True)
+    opt.add_parameter(x, bounds=(-1, 1))
+    assert opt.measure([0.5]) == 0.25
+    opt.measure_batch([[0], [1]])
+    assert opt.measure([0.5]) == 0.25
+
+def test_adaptive_grid_search():
+    from optimistic.algorithms import AdaptiveGridSearch
+    x = Parameter('x')
+    y = Parameter('y')
+
+    @experiment
+    def result():
+        return -((x-0.3)**2 + (y+0.6)**2)
+
+    opt = AdaptiveGridSearch(result, budget=60)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.add_parameter(y, bounds=(-1, 1))
+    opt.run()
+    assert len(opt.y) <= 60
+    best = opt.X[np.argmax(opt.y)]
+    assert np.allclose(best, [0.3, -0.6], atol=0.1)
+
+    opt = AdaptiveGridSearch(result, budget=8)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.add_parameter(y, bounds=(-1, 1))
+    with pytest.raises(ValueError):
+        opt.run()
+
+def test_lazy_grid():
+    from optimistic.algorithms.grid import Grid
+    axes = [np.arange(3), np.arange(2), np.arange(4)]
+    grid = Grid(axes)
+    expected = np.array(np.meshgrid(*axes, indexing='ij')).reshape(3, -1).T
+    assert len(grid) == 24
+    assert (grid[:] == expected).all()
+    assert (grid[7] == expected[7]).all()
+    shuffled = np.concatenate(list(grid.shuffled(size=5, seed=0)))
+    assert len(np.unique(shuffled, axis=0)) == 24
+
+def test_chunked_and_sampled_grid_search():
+    x = Parameter('x')
+    y = Parameter('y')
+
+    @experiment
+    def result():
+        return x**2 + y**2
+
+    opt = GridSearch(result, steps=10, chunksize=7, shard=(1, 2))
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.add_parameter(y, bounds=(-1, 1))
+    opt.run()
+    assert (opt.X == opt.generate_grid()[50:]).all()
+
+    opt = GridSearch(result, steps=10, sampling='latin', samples=10, seed=0)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.add_parameter(y, bounds=(-1, 1))
+    opt.run()
+    assert len(opt.y) == 10
+    assert len(np.unique(opt.X[:, 0])) == 10
@@ -0,0 +1,56 @@
+from optimistic.algorithms import GridSearch
+from optimistic.benchmarks import Rosenbrock
+import time
+import pytest
+
+def test_run_handle():
+    objective = Rosenbrock(2)
+    grid = GridSearch(objective.cost, sign=-1, steps=50, continuous=True, threaded=True)
+    for p in objective.parameters:
+        grid.add_parameter(p, bounds=objective.bounds)
+    handle = grid.run()
+    while handle.progress['evaluations'] < 100:
+        time.sleep(0.01)
+
+    handle.pause()
+    time.sleep(0.05)
+    evaluations = handle.progress['evaluations']
+    time.sleep(0.05)
+    assert handle.paused and not handle.done
+    assert handle.progress['evaluations'] == evaluations
+
+    handle.resume()
+    X, y = handle.snapshot()
+    assert len(X) == len(y) >= evaluations
+    handle.stop()
+    assert handle.join(timeout=5)
+    assert handle.result() is grid
+    assert grid.stop_reason == 'stopped'
+    assert handle.iterations == grid.evaluations == len(grid.y)
+
+    grid.threaded = False
+    grid.continuous = False
+    grid.execute()
+    assert grid.handle is None and grid.stop_reason is None
+    assert grid.evaluations == 2500
+
+def test_stop_grid_search():
+    objective = Rosenbrock(2, latency=1e-3)
+    grid = GridSearch(objective.cost, sign=-1, steps=60, threaded=True)
+    for p in objective.parameters:
+        grid.add_parameter(p, bounds=objective.bounds)
+    handle = grid.run()
+    time.sleep(0.05)
+    handle.stop()
+    assert handle.join(timeout=1)
+    assert grid.stop_reason == 'stopped'
+    assert 0 < grid.evaluations < 3600
+
+def test_run_handle_exception():
+    objective = Rosenbrock(2)
+    grid = GridSearch(None, threaded=True)
+    grid.add_parameter(objective.x0, bounds=objective.bounds)
+    handle = grid.run()
+    assert handle.join(timeout=5)
+    with pytest.raises(ValueError):
+        handle.result()
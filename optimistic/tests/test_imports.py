@@ -0,0 +1,19 @@
+from optimistic.benchmarks import import_time
+
+def test_lazy_imports():
+    seconds, modules = import_time('from optimistic.algorithms import GridSearch', repeat=1)
+    heavy = {'pandas', 'matplotlib', 'ipywidgets', 'tqdm', 'dask', 'distributed', 'sklearn', 'scipy'}
+    assert heavy.isdisjoint(modules)
+    assert seconds > 0
+
+def test_lazy_exports():
+    import optimistic
+    from optimistic import models
+    assert optimistic.GridSearch is optimistic.algorithms.GridSearch
+    assert 'GaussianProcess' in dir(models)
+
+def test_star_import():
+    namespace = {}
+    exec('from optimistic import *', namespace)
+    assert 'GridSearch' in namespace and 'experiment' in namespace
+    assert '_lazy' not in namespace and 'lazy' not in namespace
@@ -0,0 +1,38 @@
+from optimistic.algorithms import GridSearch
+from optimistic.algorithms.live import Trace
+from optimistic.benchmarks import Rosenbrock
+import matplotlib
+import numpy as np
+
+def test_trace_decimation():
+    values = np.random.default_rng(0).normal(size=1000)
+    trace = Trace(bins=64)
+    for chunk in np.array_split(values, 7):
+        trace.extend(chunk)
+    x, lower, upper = trace.buckets()
+    assert trace.width == 16 and len(x) == 63
+    assert lower.min() == values.min() and upper.max() == values.max()
+    assert lower[3] == values[48:64].min() and upper[3] == values[48:64].max()
+
+def test_live_plot():
+    matplotlib.use('Agg')
+    objective = Rosenbrock(2)
+    grid = GridSearch(objective.cost, sign=-1, steps=40, display=False)
+    for p in objective.parameters:
+        grid.add_parameter(p, bounds=objective.bounds)
+    live = grid.plot.live(interval=3600)
+    draws = []
+    live.render = lambda: draws.append(live.seen)
+    grid.run()
+    assert draws == [1, 1600]
+    assert live.histogram.count.sum() == 1600
+    assert live.best_cost == grid.best_cost
+
+def test_display_shows_last_observation():
+    from types import SimpleNamespace
+    objective = Rosenbrock(1)
+    grid = GridSearch(objective.cost, sign=-1, steps=50, display=True, display_interval=3600)
+    grid.add_parameter(objective.x0, bounds=objective.bounds)
+    grid.output = SimpleNamespace(value='')
+    grid.run()
+    assert grid.output.value == str(grid.X[-1]) + ' -> ' + str(grid.y[-1])
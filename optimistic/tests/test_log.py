@@ -0,0 +1,31 @@
+from parametric import Parameter
+from optimistic.algorithms import GridSearch
+from optimistic.algorithms.cache import EvaluationCache
+from optimistic.algorithms.log import ObservationLog
+from optimistic import experiment
+
+def test_resume_from_log(tmp_path):
+    path = str(tmp_path / 'scan.log')
+    x = Parameter('x')
+    calls = []
+
+    @experiment
+    def result():
+        calls.append(x())
+        return x**2
+
+    opt = GridSearch(result, steps=5, log=ObservationLog(path, flush_every=2), record_data=False)
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.run()
+    assert len(opt.y) == 0
+
+    with open(path, 'ab') as file:     # simulate a row interrupted by a crash
+        file.write(b'\x00'*5)
+
+    resumed = GridSearch.resume(path, result, steps=5, cache=EvaluationCache())
+    resumed.add_parameter(x, bounds=(-1, 1))
+    assert (resumed.y == [1, 0.25, 0, 0.25, 1]).all()
+    resumed.run()
+    assert len(calls) == 5
+    X, y = ObservationLog(path).read()
+    assert X.shape == (10, 1)
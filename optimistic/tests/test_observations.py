@@ -0,0 +1,29 @@
+from optimistic.algorithms.observations import Observations
+import numpy as np
+import pytest
+
+def test_append_grows_buffer():
+    obs = Observations(capacity=2)
+    for i in range(5):
+        obs.append([i, -i], i**2)
+    assert len(obs) == 5
+    assert obs.capacity == 8
+    assert (obs.X[:, 0] == np.arange(5)).all()
+    assert (obs.y == np.arange(5)**2).all()
+
+def test_views_share_memory():
+    obs = Observations(X=[[0, 1], [2, 3]], y=[4, 5])
+    assert np.shares_memory(obs.X, obs._X)
+    obs.extend([[6, 7]], [8])
+    assert obs.X.shape == (3, 2)
+    with pytest.raises(ValueError):
+        obs.append([1, 2, 3], 0)
+
+def test_keep_compacts_in_place():
+    obs = Observations(X=[[0, 1], [2, 3], [4, 5]], y=[6, 7, 8])
+    version = obs.version
+    buffer = obs._X
+    obs.keep(obs.y != 7)
+    assert obs._X is buffer and obs.version > version
+    assert (obs.X == [[0, 1], [4, 5]]).all()
+    assert (obs.y == [6, 8]).all()
@@ -0,0 +1,38 @@
+from parametric import Parameter
+from optimistic import experiment
+from optimistic.algorithms import GridSearch
+from optimistic.models import GaussianProcess
+from optimistic.pipeline import Pipeline, Loop, Prune, Zoom
+import numpy as np
+
+class Well:
+    def __init__(self):
+        self.x = Parameter('x', 0)
+        self.y = Parameter('y', 0)
+
+    @experiment
+    def cost(self):
+        return -np.exp(-(self.x() - 0.3)**2 - (self.y() + 0.2)**2)
+
+def test_pipeline():
+    well = Well()
+    pipeline = Pipeline(well.cost, sign=-1)
+    pipeline.add_parameter(well.x, bounds=(-2, 2))
+    pipeline.add_parameter(well.y, bounds=(-2, 2))
+    pipeline.add_block(GridSearch(steps=5))
+    pipeline.add_block(Zoom(threshold=0.3))
+    loop = Loop(loops=3)
+    loop.add_block(GaussianProcess(restarts=0, acquisition='ei', seed=0))
+    pipeline.add_block(loop)
+    pipeline.add_block(Prune(threshold=0.5))
+
+    data = pipeline.data
+    assert pipeline.data is data
+    pipeline.run()
+    assert pipeline.data is not data
+    assert pipeline.evaluations == 25 + 3
+    assert pipeline.bounds['x'] == (0, 1) and pipeline.bounds['y'] == (-1, 0)
+    assert (pipeline.y < 0.5*pipeline.best_cost).all()
+    assert loop.observations is pipeline.observations
+    normalized = pipeline.data_normalized['cost']
+    assert np.isclose(normalized.mean(), 0) and normalized.min() == normalized.iloc[np.argmin(pipeline.y)]
@@ -0,0 +1,33 @@
+from optimistic.algorithms import CMAES, DifferentialEvolution
+from optimistic.benchmarks import Rosenbrock, Rastrigin
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize('factory', [lambda e: DifferentialEvolution(e, sign=-1, generations=150, seed=0),
+                                     lambda e: CMAES(e, sign=-1, generations=150, seed=0)])
+def test_population(factory):
+    objective = Rosenbrock(3)
+    opt = factory(objective.vectorized_cost)
+    for p in objective.parameters:
+        opt.add_parameter(p, bounds=(-2, 2))
+    batches = []
+    opt.measure_batch = lambda points, measure_batch=opt.measure_batch: batches.append(len(points)) or measure_batch(points)
+    opt.run()
+    assert opt.best_cost < 1e-2
+    assert ((opt.X >= -2) & (opt.X <= 2)).all()
+    assert len(batches) >= 150 and len(set(batches[1:])) == 1
+
+def test_warm_start():
+    objective = Rastrigin(2)
+    X = np.array([[0.01, -0.01], [3, 3]])
+    y = objective.function(X)
+    de = DifferentialEvolution(objective.cost, sign=-1, X=X, y=y, generations=1, population=4, seed=0)
+    cma = CMAES(objective.cost, sign=-1, X=X, y=y, generations=1, seed=0)
+    for opt in [de, cma]:
+        for p in objective.parameters:
+            opt.add_parameter(p, bounds=(-5, 5))
+    points, costs = de.initialize(4)
+    assert (points[0] == X[0]).all() and costs[0] == y[0] and np.isnan(costs[2:]).all()
+    assert np.allclose(cma.start(), (X[0] + 5) / 10)
+    de.run()
+    assert len(de.y) == 2 + 2 + 4
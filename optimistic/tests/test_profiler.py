@@ -0,0 +1,48 @@
+from parametric import Parameter
+from optimistic.algorithms import GradientDescent
+from optimistic import experiment
+import json
+
+def test_profile_and_callbacks(tmp_path):
+    x = Parameter('x', 0.5)
+
+    @experiment
+    def result():
+        return -x**2
+
+    opt = GradientDescent(result, iterations=10)
+    opt.add_parameter(x, bounds=(-1, 1))
+    measured = []
+    iterations = []
+    opt.add_callback('on_measure', lambda algorithm, points, results: measured.append(results))
+    opt.add_callback('on_iteration', lambda algorithm, i: iterations.append(i))
+    profiler = opt.profile(trace=True)
+    opt.run()
+
+    assert iterations == list(range(10))
+    assert len(measured) == 30
+    summary = profiler.summary()
+    assert summary.loc['measure', 'calls'] == 30
+    assert summary.loc['objective', 'calls'] == 30
+    assert summary.loc['batch', 'calls'] == 10
+    profiler.save_trace(str(tmp_path / 'trace.json'))
+    with open(tmp_path / 'trace.json') as file:
+        assert len(json.load(file)['traceEvents']) == len(profiler.events)
+
+def test_profile_async_experiment():
+    import asyncio
+    from optimistic.algorithms import GridSearch
+    x = Parameter('x', 0)
+
+    @experiment
+    async def result():
+        value = x()
+        await asyncio.sleep(0.02)
+        return value
+
+    opt = GridSearch(result, steps=3, concurrency=3)
+    opt.add_parameter(x, bounds=(-1, 1))
+    profiler = opt.profile()
+    asyncio.run(opt.arun())
+    assert profiler.calls['objective'] == 3
+    assert profiler.totals['objective'] >= 3*0.02
@@ -0,0 +1,36 @@
+from optimistic.algorithms import GridSearch, Racing
+from optimistic.benchmarks import Rosenbrock
+import numpy as np
+
+def test_repeated_measurements():
+    objective = Rosenbrock(2, noise=1, seed=0)
+    grid = GridSearch(objective.vectorized_cost, sign=-1, steps=5, scans=4)
+    for p in objective.parameters:
+        grid.add_parameter(p, bounds=objective.bounds)
+    grid.run()
+    assert len(grid.y) == 25 and objective.evaluations == 100
+    mean, variance, count = grid.statistics.get(grid.X)
+    assert np.allclose(mean, grid.y) and (count == 4).all() and (variance > 0).all()
+    assert len(grid.statistics.frame(grid.parameters)) == 25
+
+def test_async_repeated_measurements():
+    import asyncio
+    objective = Rosenbrock(2, noise=1, seed=0)
+    for experiment in [objective.cost, objective.vectorized_cost]:
+        objective.reset()
+        grid = GridSearch(experiment, sign=-1, steps=5, scans=3)
+        for p in objective.parameters:
+            grid.add_parameter(p, bounds=objective.bounds)
+        asyncio.run(grid.arun())
+        assert len(grid.y) == 25 and objective.evaluations == 75
+        mean, variance, count = grid.statistics.get(grid.X)
+        assert np.allclose(mean, grid.y) and (count == 3).all()
+
+def test_racing():
+    objective = Rosenbrock(2, noise=1, seed=0)
+    racing = Racing(objective.cost, sign=-1, steps=5, shots=4, budget=2000)
+    for p in objective.parameters:
+        racing.add_parameter(p, bounds=objective.bounds)
+    racing.run()
+    assert (racing.best == [1, 1]).all()
+    assert racing.statistics.shots == objective.evaluations < 25*20
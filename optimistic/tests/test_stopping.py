@@ -0,0 +1,39 @@
+from parametric import Parameter
+from optimistic.algorithms import GradientDescent, GridSearch
+from optimistic.algorithms.stopping import Budget, GradientNorm, Stall, Target
+from optimistic import experiment
+
+def test_stopping():
+    x = Parameter('x', 0.5)
+
+    @experiment
+    def result():
+        return (x() - 0.2)**2
+
+    opt = GradientDescent(result, sign=-1, iterations=1000, learning_rate=0.1,
+                          stopping=[GradientNorm(1e-4)])
+    opt.add_parameter(x, bounds=(-1, 1))
+    opt.run()
+    assert opt.stop_reason.startswith('gradient norm')
+    assert len(opt.y) < 3000
+
+    grid = GridSearch(result, sign=-1, steps=1000, stopping=[Budget(evaluations=50)])
+    grid.add_parameter(x, bounds=(-1, 1))
+    grid.run()
+    assert len(grid.y) == 50 and grid.evaluations == 50
+
+    grid.stopping = [Stall(5)]
+    grid.continuous = True
+    grid.run()
+    assert 'unchanged' in grid.stop_reason
+
+    grid = GridSearch(result, sign=-1, steps=1000, stopping=[Target(1e-3)])
+    grid.add_parameter(x, bounds=(-1, 1))
+    grid.run()
+    assert grid.stop_reason.startswith('target')
+    assert grid.best_cost <= 1e-3 and grid.evaluations < 1000
+
+    grid = GridSearch(result, sign=-1, steps=1000, stopping=[Stall(5)])
+    grid.add_parameter(x, bounds=(-1, 1))
+    grid.run()
+    assert 'unchanged' in grid.stop_reason and grid.evaluations < 1000
@@ -0,0 +1,43 @@
+from optimistic.algorithms import GradientDescent, SuccessiveHalving, Hyperband
+from optimistic.algorithms.cache import EvaluationCache
+from optimistic import experiment
+from parametric import Parameter
+import numpy as np
+
+class Bowl:
+    def __init__(self):
+        self.x = Parameter('x', 1)
+        self.y = Parameter('y', 1)
+
+    @experiment
+    def cost(self):
+        return (self.x() - 0.2)**2 + (self.y() + 0.3)**2
+
+def descent(**kwargs):
+    bowl = Bowl()
+    gd = GradientDescent(bowl.cost, sign=-1, **kwargs)
+    gd.add_parameter(bowl.x, bounds=(-2, 2))
+    gd.add_parameter(bowl.y, bounds=(-2, 2))
+    return bowl, gd
+
+def test_metacost():
+    bowl, gd = descent(iterations=20, learning_rate=0.1)
+    metacost = gd.metacost()
+    assert np.isclose(metacost, -gd.y.sum())
+    assert bowl.x() == 1
+
+def test_successive_halving():
+    bowl, gd = descent(iterations=100, cache=EvaluationCache())
+
+    meta = SuccessiveHalving(gd.metacost, configurations=9, min_evaluations=10,
+                             logarithmic=True, seed=0, executor='thread')
+    meta.add_parameter(gd.learning_rate, bounds=(1e-4, 0.5))
+    meta.run()
+    assert len(meta.y) == 9 + 3 + 1
+    assert meta.best[0] > 0.01
+    assert gd.cache.hits > 0
+
+    hyperband = Hyperband(gd.metacost, min_evaluations=10, max_evaluations=90, logarithmic=True, seed=0)
+    hyperband.add_parameter(gd.learning_rate, bounds=(1e-4, 0.5))
+    hyperband.run()
+    assert len(hyperband.y) == (9 + 3 + 1) + (5 + 1) + 3
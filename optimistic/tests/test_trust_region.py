@@ -0,0 +1,25 @@
+from optimistic.algorithms import TrustRegion
+from optimistic.benchmarks import Rosenbrock
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize('dim,target', [(2, 1e-4), (4, 1e-2)])
+def test_trust_region(dim, target):
+    objective = Rosenbrock(dim)
+    tr = TrustRegion(objective.cost, sign=-1, iterations=1000, seed=0)
+    for p in objective.parameters:
+        tr.add_parameter(p, bounds=objective.bounds)
+    tr.run()
+    assert tr.best_cost < target
+    assert tr.stop_reason.startswith('trust radius')
+    assert len(tr.y) < 150*dim
+
+def test_warm_start():
+    objective = Rosenbrock(2)
+    X = np.array([[0.9, 0.81], [0, 0]])
+    tr = TrustRegion(objective.cost, sign=-1, X=X, y=objective.function(X), iterations=5, seed=0)
+    for p in objective.parameters:
+        tr.add_parameter(p, bounds=objective.bounds)
+    tr.run()
+    assert objective.evaluations <= 5 + 3 + 5
+    assert tr.best_cost <= objective.function(X)[0]